@@ -0,0 +1,64 @@
+"""
+Render radio and checkbox lists with 1000 choices.
+
+``RadioField`` renders its options from precomputed templates, ``per option``
+is the same field rendered option by option through the
+``BootstrapRadioDecorator`` chain, as the templates aren't used with a
+plain :class:`~wtforms_widgets.widgets.BootstrapFieldListWidget`.
+``choice set`` uses a :class:`~wtforms_widgets.choices.ChoiceSet`, whose
+escaped values and labels are computed once.
+
+Run with ``python -m benchmarks.choice_lists``.
+"""
+import timeit
+
+from flask import Flask
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.choices import ChoiceSet
+from wtforms_widgets.fields.core import RadioField, SelectMultipleField
+from wtforms_widgets.widgets import BootstrapFieldListWidget, CheckBoxWidget
+
+CHOICES = [(str(i), 'Permission <{}>'.format(i)) for i in range(1000)]
+
+
+class Form(BaseForm):
+    class Meta:
+        csrf = False
+
+    radio = RadioField('Radio', choices=CHOICES, default='500')
+    choice_set = RadioField('Radio', choices=ChoiceSet(CHOICES),
+                            default='500')
+    per_option = RadioField('Radio', choices=CHOICES, default='500',
+                            widget=BootstrapFieldListWidget())
+    checkboxes = SelectMultipleField('Checkboxes', choices=CHOICES,
+                                     default=['1', '999'],
+                                     widget=CheckBoxWidget())
+
+
+def main(number=20):
+    app = Flask(__name__)
+    with app.test_request_context():
+        form = Form()
+        for mode in ('basic', 'horizontal'):
+            assert (str(form.radio(render_mode=mode))
+                    == str(form.per_option(render_mode=mode))
+                    .replace('per_option', 'radio'))
+        cases = [
+            ('radio basic', lambda: form.radio(render_mode='basic')),
+            ('radio horizontal', lambda: form.radio(render_mode='horizontal')),
+            ('choice set basic',
+             lambda: form.choice_set(render_mode='basic')),
+            ('per option basic', lambda: form.per_option(render_mode='basic')),
+            ('per option horizontal',
+             lambda: form.per_option(render_mode='horizontal')),
+            ('checkboxes', lambda: form.checkboxes.widget(form.checkboxes)),
+        ]
+        for name, render in cases:
+            seconds = min(timeit.repeat(render, number=number, repeat=3))
+            print('{:<22} {:8.3f} ms per render'.format(
+                name, seconds / number * 1000))
+
+
+if __name__ == '__main__':
+    main()
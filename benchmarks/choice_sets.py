@@ -0,0 +1,69 @@
+"""
+Compare binding and validating forms with 50k choices given as list against
+the same choices given as :class:`~wtforms_widgets.choices.ChoiceSet`.
+
+Memory is the size of 100 bound forms as measured by :mod:`tracemalloc`.
+
+Run with ``python -m benchmarks.choice_sets``.
+"""
+import timeit
+import tracemalloc
+
+from flask import Flask
+from werkzeug.datastructures import MultiDict
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.choices import choice_sets
+from wtforms_widgets.fields.core import RadioField, SelectField, \
+    SelectMultipleField
+
+CHOICES = [(str(i), 'Building {}'.format(i)) for i in range(50000)]
+BUILDINGS = choice_sets.register('buildings', CHOICES)
+FORMDATA = MultiDict([('building', '49999'), ('buildings', '1'),
+                      ('buildings', '49999'), ('radio', '25000')])
+
+
+def make_form(name, choices):
+    class Meta:
+        csrf = False
+
+    return type(name, (BaseForm,), {
+        'Meta': Meta,
+        'building': SelectField('Building', choices=choices),
+        'buildings': SelectMultipleField('Buildings', choices=choices),
+        'radio': RadioField('Building', choices=choices),
+    })
+
+
+ListForm = make_form('ListForm', CHOICES)
+ChoiceSetForm = make_form('ChoiceSetForm', BUILDINGS)
+
+
+def validate(form_class):
+    form = form_class(formdata=FORMDATA)
+    assert form.validate(), form.errors
+
+
+def memory(form_class, count=100):
+    tracemalloc.start()
+    forms = [form_class() for _ in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del forms
+    return size
+
+
+def main(number=20):
+    app = Flask(__name__)
+    with app.test_request_context():
+        for form_class in (ListForm, ChoiceSetForm):
+            seconds = min(timeit.repeat(lambda: validate(form_class),
+                                        number=number, repeat=3))
+            print('{:<14} {:8.3f} ms per bind and validate {:10.1f} KiB per '
+                  '100 forms'.format(form_class.__name__,
+                                     seconds / number * 1000,
+                                     memory(form_class) / 1024))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Memory and attribute access cost of the slot based widget decorators.
+
+``instance`` compares the size of a decorator instance with the one of an
+equivalent object with ``__dict__``, ``lookup`` the time of reading the
+decorated widget as done by every decorator on the render path, and
+``static fields`` the memory of 1000 unbound fields wrapped with
+:func:`~wtforms_widgets.fields.custom.static` and
+:func:`~wtforms_widgets.fields.custom.disabled`, which share their widget
+chains.
+
+Run with ``python -m benchmarks.compact_widgets``.
+"""
+import sys
+import timeit
+import tracemalloc
+
+from flask import Flask
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields.core import StringField
+from wtforms_widgets.fields.custom import disabled, static
+from wtforms_widgets.widgets import BootstrapFormControlDecorator
+
+FIELD_COUNT = 1000
+
+
+class DictDecorator(object):
+    """A decorator as it was before ``__slots__``."""
+
+    def __init__(self, widget):
+        self.widget = widget
+
+
+def instance_size(obj):
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def static_fields():
+    tracemalloc.start()
+    fields = [static(StringField('F')) for _ in range(FIELD_COUNT // 2)]
+    fields += [disabled(StringField('F')) for _ in range(FIELD_COUNT // 2)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    widgets = {id(field.kwargs['widget']) for field in fields}
+    return size, len(widgets)
+
+
+def main(number=1000000):
+    widget = StringField.widget
+    slotted = BootstrapFormControlDecorator(widget)
+    plain = DictDecorator(widget)
+    for name, obj in (('slots', slotted), ('dict', plain)):
+        seconds = min(timeit.repeat(lambda: obj.widget, number=number,
+                                    repeat=3))
+        print('{:<6} instance={:4} bytes lookup={:6.1f} ns'.format(
+            name, instance_size(obj), seconds / number * 1e9))
+
+    size, distinct = static_fields()
+    print('static fields: {} fields, {} distinct widget chains, '
+          '{:.1f} KiB'.format(FIELD_COUNT, distinct, size / 1024))
+
+    class Meta:
+        csrf = False
+
+    form_class = type('StaticForm', (BaseForm,), dict(
+        {'f{}'.format(i): static(StringField('F')) for i in range(100)},
+        Meta=Meta))
+    app = Flask(__name__)
+    with app.test_request_context():
+        form = form_class()
+        seconds = min(timeit.repeat(
+            lambda: [field(render_mode='horizontal') for field in form],
+            number=100, repeat=3))
+    print('render 100 static fields: {:.3f} ms'.format(seconds / 100 * 1000))
+
+
+if __name__ == '__main__':
+    main()
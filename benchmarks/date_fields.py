@@ -0,0 +1,34 @@
+"""
+Measure binding a form with 50 date fields.
+
+Run with ``python -m benchmarks.date_fields``.
+"""
+import timeit
+
+from flask import Flask
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields.core import DateField
+
+
+class Meta:
+    csrf = False
+
+
+DateForm = type('DateForm', (BaseForm,), dict(
+    {'date_{}'.format(i): DateField('Date {}'.format(i), format='%d.%m.%Y')
+     for i in range(50)},
+    Meta=Meta,
+))
+
+
+def main(number=500):
+    app = Flask(__name__)
+    with app.test_request_context():
+        seconds = min(timeit.repeat(DateForm, number=number, repeat=5))
+        print('{:<12} {:8.3f} ms per bind'.format(
+            DateForm.__name__, seconds / number * 1000))
+
+
+if __name__ == '__main__':
+    main()
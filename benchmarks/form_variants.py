@@ -0,0 +1,82 @@
+"""
+Build read-only and disabled widgets and form classes, as form factories
+called per request do.
+
+``legacy`` builds the widget chains like :func:`static` and :func:`disabled`
+did before their results were cached per widget chain: the chain is walked
+and looked up by value on every call. ``factory`` defines a read-only form
+class per request, ``static_form`` returns the cached variant.
+
+Run with ``python -m benchmarks.form_variants``.
+"""
+import timeit
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields.core import IntegerField, MoneyField, \
+    SelectField, StringField
+from wtforms_widgets.fields.custom import MacField, disabled, static, \
+    static_form
+from wtforms_widgets.widgets import BootstrapStaticFieldWidget, Disabler, \
+    decorate, decorators
+
+FIELD_TYPES = (StringField, IntegerField, MoneyField, MacField)
+COUNT = 40
+
+
+def legacy_static(field):
+    widget = field.kwargs.get("widget", field.field_class.widget)
+    field.kwargs["widget"] = decorate(BootstrapStaticFieldWidget(),
+                                      *reversed(list(decorators(widget))))
+    return field
+
+
+def legacy_disabled(field):
+    widget = field.kwargs.get("widget", field.field_class.widget)
+    field.kwargs["widget"] = decorate(widget, Disabler)
+    return field
+
+
+def fields():
+    return {'f{}'.format(i): FIELD_TYPES[i % len(FIELD_TYPES)](
+        'Field {}'.format(i)) for i in range(COUNT)}
+
+
+class UserForm(BaseForm):
+    class Meta:
+        csrf = False
+
+    locals().update(fields())
+    room = SelectField('Room', choices=[('1', 'Wu 1')])
+
+
+def factory(transform):
+    return type('StaticUserForm', (BaseForm,), {
+        name: transform(field) for name, field in fields().items()})
+
+
+def main(number=200):
+    unbound = [field for _, field in sorted(fields().items())]
+
+    def apply(transform):
+        for field in unbound:
+            field.kwargs.pop('widget', None)
+            transform(field)
+    for name, transform in (('legacy static', legacy_static),
+                            ('static', static),
+                            ('legacy disabled', legacy_disabled),
+                            ('disabled', disabled)):
+        seconds = min(timeit.repeat(lambda: apply(transform),
+                                    number=number, repeat=3))
+        print('{:<22} {:8.2f} us per field'.format(
+            name, seconds / number / COUNT * 1e6))
+
+    assert static_form(UserForm) is static_form(UserForm)
+    for name, run in (('factory per request', lambda: factory(static)),
+                      ('static_form', lambda: static_form(UserForm))):
+        seconds = min(timeit.repeat(run, number=number, repeat=3))
+        print('{:<22} {:8.2f} us per form'.format(
+            name, seconds / number * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Check the import time of the field modules against a budget.
+
+Every module is imported in a fresh interpreter with ``python -X importtime``
+and the best cumulative time of several runs is compared with the budget.
+The check also fails if an import pulls in one of the optional integrations
+(Flask, Jinja, SQLAlchemy, asyncio), which are loaded on first use only.
+
+Run with::
+
+    python -m benchmarks.import_time --budget 150
+
+The command exits with status 1 if a module exceeds the budget.
+"""
+import argparse
+import subprocess
+import sys
+
+MODULES = (
+    'wtforms_widgets.widgets',
+    'wtforms_widgets.fields.core',
+    'wtforms_widgets.fields.custom',
+)
+LAZY_MODULES = ('flask', 'jinja2', 'sqlalchemy', 'wtforms_sqlalchemy',
+                'asyncio')
+
+
+def import_time(module):
+    """
+    :returns: cumulative import time of ``module`` in seconds and the lazy
+        modules it imported
+    """
+    code = 'import sys, {0}; print(" ".join(m for m in {1!r} if m in sys.modules))'
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c',
+         code.format(module, LAZY_MODULES)],
+        capture_output=True, text=True, check=True,
+    )
+    for line in process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        _, cumulative, name = line.split('|')
+        if name.strip() == module:
+            return int(cumulative) / 1e6, process.stdout.split()
+    raise ValueError("No import time reported for {0}".format(module))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--budget', type=float, default=150,
+                        help='allowed milliseconds per module '
+                             '(default: %(default)s)')
+    parser.add_argument('--runs', type=int, default=5,
+                        help='imports per module (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module in MODULES:
+        results = [import_time(module) for _ in range(args.runs)]
+        seconds = min(seconds for seconds, _ in results)
+        lazy = results[0][1]
+        ok = seconds * 1000 <= args.budget and not lazy
+        failed = failed or not ok
+        print('{:<4} {:<32} {:8.1f} ms{}'.format(
+            'ok' if ok else 'FAIL', module, seconds * 1000,
+            ' imports ' + ', '.join(lazy) if lazy else ''))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Parse and validate intervals of the :class:`IntervalField`.
+
+``legacy`` is the string based check the field used before its data became
+an :class:`~wtforms_widgets.fields.custom.Interval`: it split and compared
+the tokens on every validation and left parsing the values to the caller.
+
+Run with ``python -m benchmarks.intervals``.
+"""
+import timeit
+
+from flask import Flask
+from werkzeug.datastructures import MultiDict
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields.custom import IntervalField, parse_interval, \
+    parse_intervals, expected_interval_format
+
+UNITS = ['years', 'mons', 'days', 'hours', 'mins', 'secs']
+TEXTS = ['0 years {} mons {} days {} hours 0 mins {} secs'.format(
+    i % 12, i % 31, i % 24, i % 60) for i in range(1, 10001)]
+
+
+def legacy_parse(text):
+    expected_interval_format(UNITS)
+    tokens = [x for x in text.split(' ') if x]
+    values = tokens[::2]
+    units = tokens[1::2]
+    if not len(values) == len(units) == len(UNITS) or units != UNITS:
+        raise ValueError(text)
+    return tuple(int(val) for val in values)
+
+
+class Form(BaseForm):
+    class Meta:
+        csrf = False
+
+    interval = IntervalField('Interval')
+
+
+def main(number=3):
+    assert ([tuple(interval) for interval in parse_intervals(TEXTS)]
+            == [legacy_parse(text) for text in TEXTS])
+    cases = [
+        ('legacy parse', lambda: [legacy_parse(text) for text in TEXTS]),
+        ('parse_interval', lambda: [parse_interval(text) for text in TEXTS]),
+        ('parse_intervals', lambda: parse_intervals(TEXTS)),
+    ]
+    for name, run in cases:
+        seconds = min(timeit.repeat(run, number=number, repeat=3))
+        print('{:<22} {:8.3f} us per interval'.format(
+            name, seconds / number / len(TEXTS) * 1e6))
+
+    app = Flask(__name__)
+    with app.test_request_context():
+        formdata = MultiDict([('interval', TEXTS[0])])
+
+        def validate():
+            return Form(formdata=formdata).validate()
+        assert validate()
+        seconds = min(timeit.repeat(validate, number=1000, repeat=3))
+        print('{:<22} {:8.3f} us per form'.format(
+            'process and validate', seconds / 1000 * 1e6))
+
+
+if __name__ == '__main__':
+    main()
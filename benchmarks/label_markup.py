@@ -0,0 +1,115 @@
+"""
+Render fields with labels and descriptions in the standard and the check
+layouts.
+
+``legacy`` renders with the implementation before labels and descriptions
+were taken from :func:`~wtforms_widgets.widgets.escaped_text`: every piece
+was wrapped with :meth:`Markup.format`, re-escaping the label text on each
+render. ``peak`` is the largest amount of memory allocated by tracemalloc
+while rendering one field, temporary copies included.
+
+Run with ``python -m benchmarks.label_markup``.
+"""
+import timeit
+import tracemalloc
+
+from flask import Flask
+from markupsafe import Markup, escape
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields.core import BooleanField, StringField
+from wtforms_widgets.widgets import BootstrapRadioCheckboxDecorator, \
+    BootstrapStandardDecorator
+
+COUNT = 200
+
+
+@BootstrapStandardDecorator.register_render_mode('legacy_basic')
+def legacy_basic(self, field, **kwargs):
+    html = [field.label(), '<br/>', self.widget(field, **kwargs)]
+    help_block = Markup(u'<span class="form-text">{0}</span>')
+    if field.description:
+        html.append(help_block.format(field.description))
+    html.extend(help_block.format(e) for e in field.errors)
+    return Markup(u''.join(html))
+
+
+@BootstrapStandardDecorator.register_render_mode('legacy_horizontal')
+def legacy_horizontal(self, field, **kwargs):
+    error_html = [Markup('<div class="invalid-feedback">{0}</div>').format(e)
+                  for e in field.errors]
+    desc_html = []
+    if field.description:
+        desc_html.append(Markup('<div class="col-sm-12"><span class="form-text">'
+                                '{0}</span></div>').format(field.description))
+    label_classes = ['col-form-label']
+    if field.errors:
+        label_classes.append('text-danger')
+    return Markup(u''.join([
+        f'<div class="row" id="form-group-{field.name}">',
+        '<div class="col-sm-4">', field.label(class_=' '.join(label_classes)),
+        *desc_html, '</div>', '<div class="col-sm-4">',
+        self.widget(field, **kwargs), *error_html, '</div>', '</div>']))
+
+
+@BootstrapRadioCheckboxDecorator.register_render_mode('legacy_basic')
+def legacy_check(self, field, **kwargs):
+    input_classes = kwargs.get('class_', '').split()
+    kwargs['class_'] = ' '.join(input_classes + ['form-check-input'])
+    return Markup(u''.join([
+        u'<div class="form-check">', self.widget(field, **kwargs),
+        field.label(escape(field.label.text), class_='form-check-label'),
+        u'</div>']))
+
+
+@BootstrapRadioCheckboxDecorator.register_render_mode('legacy_horizontal')
+def legacy_check_horizontal(self, field, **kwargs):
+    return Markup(u''.join([
+        u'<div class="row" id="form-group-{0}"><div class="offset-sm-4 '
+        u'col-sm-4">'.format(escape(field.name)),
+        legacy_check(self, field, **kwargs), u'</div></div>']))
+
+
+class Meta:
+    csrf = False
+
+
+LabelForm = type('LabelForm', (BaseForm,), dict({
+    'f{}'.format(i): (BooleanField if i % 4 == 0 else StringField)(
+        'Field <{}> & label'.format(i),
+        description='Description {} "quoted"'.format(i))
+    for i in range(COUNT)
+}, Meta=Meta))
+
+
+def peak(render):
+    render()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        render()
+        return tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+
+def main(number=20):
+    app = Flask(__name__)
+    with app.test_request_context():
+        form = LabelForm()
+        form.f1.errors = ['Not <valid>']
+        for mode in ('basic', 'horizontal'):
+            def render(mode):
+                return [str(field(render_mode=mode)) for field in form]
+            assert render(mode) == render('legacy_' + mode)
+            for name in ('legacy_' + mode, mode):
+                seconds = min(timeit.repeat(lambda: render(name),
+                                            number=number, repeat=5))
+                print('{:<18} {:7.2f} us  peak {:6.0f} B per field'.format(
+                    name, seconds / number / COUNT * 1e6,
+                    peak(lambda: str(form.f1(render_mode=name)))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Compare eager and lazy binding of a form with 500 fields.
+
+``construct`` binds the form with form data, ``access 2`` additionally
+reads and validates two fields (as an AJAX validation of a single field
+would), ``validate`` validates the whole form. Memory is the size of one
+constructed form as measured by :mod:`tracemalloc`.
+
+Run with ``python -m benchmarks.lazy_binding``.
+"""
+import timeit
+import tracemalloc
+
+from flask import Flask
+from werkzeug.datastructures import MultiDict
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields.core import DateField, IntegerField, StringField
+from wtforms_widgets.fields.custom import IntervalField, MacField
+
+FIELD_FACTORIES = (
+    lambda: StringField('String'),
+    lambda: IntegerField('Integer'),
+    lambda: DateField('Date', format='%d.%m.%Y'),
+    lambda: MacField('MAC'),
+    lambda: IntervalField('Interval'),
+)
+FIELD_COUNT = 500
+# IntervalField rejects empty intervals
+FORMDATA = MultiDict([('f0', 'value'), ('f1', '42')] + [
+    ('f{}'.format(i), '0 years 0 mons 1 days 0 hours 0 mins 0 secs')
+    for i in range(4, FIELD_COUNT, len(FIELD_FACTORIES))
+])
+
+
+def make_form(name, lazy):
+    class Meta:
+        csrf = False
+
+    attrs = {
+        'f{}'.format(i): FIELD_FACTORIES[i % len(FIELD_FACTORIES)]()
+        for i in range(FIELD_COUNT)
+    }
+    return type(name, (BaseForm,), dict(attrs, Meta=Meta,
+                                        _lazy_binding=lazy))
+
+
+EagerForm = make_form('EagerForm', False)
+LazyForm = make_form('LazyForm', True)
+
+
+def construct(form_class):
+    return form_class(formdata=FORMDATA)
+
+
+def access(form_class):
+    form = form_class(formdata=FORMDATA)
+    form.f0.validate(form)
+    form.f1.validate(form)
+
+
+def validate(form_class):
+    form_class(formdata=FORMDATA).validate()
+
+
+def memory(form_class):
+    tracemalloc.start()
+    form = construct(form_class)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del form
+    return size
+
+
+def main(number=20):
+    app = Flask(__name__)
+    with app.test_request_context():
+        for form_class in (EagerForm, LazyForm):
+            cells = []
+            for step in (construct, access, validate):
+                seconds = min(timeit.repeat(lambda: step(form_class),
+                                            number=number, repeat=3))
+                cells.append('{}={:.3f}ms'.format(
+                    step.__name__, seconds / number * 1000))
+            cells.append('memory={:.1f}KiB'.format(memory(form_class) / 1024))
+            print('{:<10} {}'.format(form_class.__name__, ' '.join(cells)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Validate a bulk submission of 20000 rows serially and in a process pool.
+
+The errors and the normalized data of both runs are compared before the
+timings are printed. ``cpu`` is the time spent in the validating process
+itself, i.e. the time a web worker is blocked besides waiting for the pool.
+The speedup of the wall time depends on the number of CPUs.
+
+Run with ``python -m benchmarks.parallel_validation [workers]``.
+"""
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from flask import Flask
+from werkzeug.datastructures import MultiDict
+from wtforms.validators import DataRequired, Length
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields.core import FieldList, FormField, SelectField, \
+    StringField
+from wtforms_widgets.fields.validators import MacAddress, OptionalIf
+
+ROWS = 20000
+
+
+class Row(BaseForm):
+    class Meta:
+        csrf = False
+
+    name = StringField('Name', [DataRequired(), Length(max=20)])
+    mac = StringField('MAC', [MacAddress(normalize=True)])
+    building = SelectField('Building', choices=[('1', 'Wu 1'), ('2', 'Wu 3')])
+    comment = StringField('Comment', [OptionalIf('name')])
+
+
+class Import(BaseForm):
+    class Meta:
+        csrf = False
+
+    rows = FieldList(FormField(Row))
+
+
+def formdata():
+    data = MultiDict()
+    for i in range(ROWS):
+        data.add('rows-{}-name'.format(i), '' if i % 97 == 0 else 'host{}'.format(i))
+        data.add('rows-{}-mac'.format(i), '00-DE-AD-BE-{:02X}-{:02X}'.format(
+            i // 256 % 256, i % 256) if i % 89 else 'zz')
+        data.add('rows-{}-building'.format(i), '3' if i % 83 == 0 else '1')
+        data.add('rows-{}-comment'.format(i), '')
+    return data
+
+
+def result(form):
+    return form.errors, form.data
+
+
+def main(workers=None):
+    app = Flask(__name__)
+    data = formdata()
+    with app.test_request_context(), \
+            ProcessPoolExecutor(workers or os.cpu_count()) as executor:
+        serial = Import(formdata=data)
+        serial.validate()
+        parallel = Import(formdata=data)
+        parallel.validate(executor=executor)
+        assert result(serial) == result(parallel)
+
+        def measure(**kwargs):
+            form = Import(formdata=data)
+            wall, cpu = time.perf_counter(), time.process_time()
+            form.validate(**kwargs)
+            return time.perf_counter() - wall, time.process_time() - cpu
+        for name, kwargs in (('serial', {}),
+                             ('process pool', {'executor': executor})):
+            wall, cpu = min(measure(**kwargs) for _ in range(3))
+            print('{:<14} wall {:8.1f} ms  cpu {:8.1f} ms'.format(
+                name, wall * 1000, cpu * 1000))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,78 @@
+"""
+Compare validating a form with 500 fields as a whole against validating a
+single field through :mod:`wtforms_widgets.validation`, as done on every
+keystroke of a live validating frontend.
+
+All numbers are per request and include the Flask test client.
+
+Run with ``python -m benchmarks.partial_validation``.
+"""
+import timeit
+
+from flask import Flask, jsonify
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields.core import DateField, IntegerField, StringField
+from wtforms_widgets.fields.custom import MacField
+from wtforms_widgets.fields.validators import OptionalIf
+from wtforms_widgets.validation import validation_view
+
+FIELD_FACTORIES = (
+    lambda: StringField('String'),
+    lambda: IntegerField('Integer'),
+    lambda: DateField('Date', format='%d.%m.%Y'),
+    lambda: MacField('MAC'),
+    lambda: StringField('Depending', [OptionalIf('f0')]),
+)
+FIELD_COUNT = 500
+FORMDATA = {'f0': 'value', 'f1': '42'}
+
+
+def make_form(name, lazy):
+    class Meta:
+        csrf = False
+
+    attrs = {
+        'f{}'.format(i): FIELD_FACTORIES[i % len(FIELD_FACTORIES)]()
+        for i in range(FIELD_COUNT)
+    }
+    return type(name, (BaseForm,), dict(attrs, Meta=Meta,
+                                        _lazy_binding=lazy))
+
+
+def full_view(form_class):
+    def view():
+        form = form_class()
+        form.validate()
+        return jsonify(form.errors)
+    view.__name__ = 'full_{}'.format(form_class.__name__)
+    return view
+
+
+def main(number=20):
+    app = Flask(__name__)
+    urls = []
+    for form_class in (make_form('EagerForm', False),
+                       make_form('LazyForm', True)):
+        name = form_class.__name__
+        app.add_url_rule('/full/' + name, view_func=full_view(form_class),
+                         methods=['POST'])
+        app.add_url_rule('/field/' + name,
+                         view_func=validation_view(form_class),
+                         methods=['POST'])
+        urls.append(('{} full'.format(name), '/full/' + name))
+        urls.append(('{} field=f1'.format(name), '/field/{}?field=f1'.format(name)))
+        # f0 decides 100 OptionalIf fields, which are validated as well
+        urls.append(('{} field=f0'.format(name), '/field/{}?field=f0'.format(name)))
+
+    client = app.test_client()
+    for label, url in urls:
+        assert client.post(url, data=FORMDATA).status_code == 200
+        seconds = min(timeit.repeat(lambda: client.post(url, data=FORMDATA),
+                                    number=number, repeat=3))
+        print('{:<22} {:8.3f} ms per request'.format(
+            label, seconds / number * 1000))
+
+
+if __name__ == '__main__':
+    main()
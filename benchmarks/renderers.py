@@ -0,0 +1,56 @@
+"""
+Compare the render throughput of the string and the Jinja renderer, and of
+the string renderer used by default, without a renderer configured.
+
+Run with ``python -m benchmarks.renderers``.
+"""
+import timeit
+
+from flask import Flask
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields.core import BooleanField, IntegerField, \
+    MoneyField, StringField
+from wtforms_widgets.fields.custom import MacField
+from wtforms_widgets.renderers import JinjaRenderer, StringRenderer
+
+FIELD_TYPES = (StringField, IntegerField, BooleanField, MoneyField, MacField)
+
+
+def make_form(renderer, count=200):
+    class Meta:
+        csrf = False
+
+    Meta.renderer = renderer
+    fields = {
+        'f{}'.format(i): FIELD_TYPES[i % len(FIELD_TYPES)](
+            'Field {}'.format(i), description='Description {}'.format(i))
+        for i in range(count)
+    }
+    return type('RendererForm', (BaseForm,), dict(fields, Meta=Meta))
+
+
+def main(number=20):
+    app = Flask(__name__)
+    forms = [make_form(None), make_form(StringRenderer()),
+             make_form(JinjaRenderer())]
+    with app.test_request_context():
+        for mode in ('basic', 'horizontal'):
+            results = []
+            for form_class in forms:
+                form = form_class()
+
+                def render():
+                    return [str(field(render_mode=mode)) for field in form]
+
+                results.append(render())
+                seconds = min(timeit.repeat(render, number=number, repeat=3))
+                print('{:<16} {:<10} {:8.0f} fields/s'.format(
+                    type(form.meta.renderer).__name__
+                    if form.meta.renderer else 'default', mode,
+                    len(form._fields) * number / seconds))
+            assert results[0] == results[1] == results[2]
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Compare rendering a select field with 10k options one by one against
+rendering it from a shared option block.
+
+Run with ``python -m benchmarks.select_options``.
+"""
+import timeit
+
+from flask import Flask
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields.core import SelectField, SelectMultipleField
+
+CHOICES = [(str(i), 'Room {}'.format(i)) for i in range(10000)]
+
+
+class PlainForm(BaseForm):
+    class Meta:
+        csrf = False
+
+    room = SelectField('Room', choices=CHOICES, default='5000')
+    rooms = SelectMultipleField('Rooms', choices=CHOICES,
+                                default=['1', '9999'])
+
+
+class SharedForm(BaseForm):
+    class Meta:
+        csrf = False
+
+    room = SelectField('Room', choices=CHOICES, default='5000',
+                       options_key=('rooms', 1))
+    rooms = SelectMultipleField('Rooms', choices=CHOICES,
+                                default=['1', '9999'],
+                                options_key=('rooms', 1))
+
+
+def render(form_class):
+    form = form_class()
+    return form.room(render_mode='horizontal'), form.rooms(render_mode='horizontal')
+
+
+def main(number=20):
+    app = Flask(__name__)
+    with app.test_request_context():
+        assert render(PlainForm) == render(SharedForm)
+        for form_class in (PlainForm, SharedForm):
+            seconds = min(timeit.repeat(lambda: render(form_class),
+                                        number=number, repeat=3))
+            print('{:<12} {:8.3f} ms per render'.format(
+                form_class.__name__, seconds / number * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,348 @@
+"""
+Benchmark suite covering every field type and render mode.
+
+For every field class of :mod:`wtforms_widgets.fields.core` and
+:mod:`wtforms_widgets.fields.custom` a form is built at several scales (the
+number of fields, choices or rows, depending on the field type) and the
+following steps are timed:
+
+``bind``
+    Instantiating the form without form data.
+``process``
+    Instantiating the form with form data, i.e. ``process_formdata``.
+``validate``
+    Validating the processed form.
+``render_basic``, ``render_horizontal``, ``render_inline``
+    Rendering all fields in the given mode.
+
+Everything runs offline inside a throwaway Flask app and request context.
+Run with::
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --baseline results.json
+
+The second call exits with status 1 if a timing got slower than the baseline
+by more than the threshold factor, if a step raised an error it didn't raise
+in the baseline or if a step of the baseline is missing. ``--save-baseline``
+writes the results to the baseline file instead of comparing.
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+from collections import namedtuple
+from importlib.metadata import version
+
+from flask import Flask
+from werkzeug.datastructures import MultiDict
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields import core, custom
+
+RENDER_MODES = ('basic', 'horizontal', 'inline')
+DEFAULT_SCALES = (1, 100, 10000)
+
+Case = namedtuple('Case', 'name scale form_class formdata')
+
+CASES = []
+
+
+def case(name):
+    """Register a function building a :class:`Case` for a given scale."""
+    def register(builder):
+        CASES.append((name, builder))
+        return builder
+    return register
+
+
+class Meta:
+    csrf = False
+
+
+def make_form(name, fields):
+    return type(name, (BaseForm,), dict(fields, Meta=Meta))
+
+
+def fields_case(name, field_factory, value):
+    """A form with ``scale`` fields of one type."""
+    def builder(scale):
+        form_class = make_form(name, {
+            'f{}'.format(i): field_factory() for i in range(scale)
+        })
+        formdata = MultiDict()
+        if value is not None:
+            for i in range(scale):
+                formdata.add('f{}'.format(i), value)
+        return Case(name, scale, form_class, formdata)
+    return case(name)(builder)
+
+
+def choices_case(name, field_class, multiple=False):
+    """A form with one choice field of ``scale`` choices."""
+    def builder(scale):
+        choices = [(str(i), 'Choice {}'.format(i)) for i in range(scale)]
+        form_class = make_form(name, {'f': field_class('F', choices=choices)})
+        formdata = MultiDict([('f', '0')])
+        if multiple:
+            formdata.add('f', str(scale - 1))
+        return Case(name, scale, form_class, formdata)
+    return case(name)(builder)
+
+
+fields_case('StringField', lambda: core.StringField('F'), 'value')
+fields_case('TextField', lambda: core.TextField('F'), 'value')
+fields_case('IntegerField', lambda: core.IntegerField('F'), '42')
+fields_case('DecimalField', lambda: core.DecimalField('F'), '4.2')
+fields_case('MoneyField', lambda: core.MoneyField('F'), '4,20')
+fields_case('FloatField', lambda: core.FloatField('F'), '4.2')
+fields_case('BooleanField', lambda: core.BooleanField('F'), 'y')
+fields_case('DateTimeField', lambda: core.DateTimeField('F'),
+            '2020-01-02 03:04:05')
+fields_case('TimeField', lambda: core.TimeField('F'), '03:04')
+fields_case('DateField', lambda: core.DateField('F', format='%d.%m.%Y'),
+            '02.01.2020')
+fields_case('TextAreaField', lambda: core.TextAreaField('F'), 'value')
+fields_case('PasswordField', lambda: core.PasswordField('F'), 'secret')
+fields_case('FileField', lambda: core.FileField('F'), None)
+fields_case('HiddenField', lambda: core.HiddenField('F'), 'value')
+fields_case('SubmitField', lambda: core.SubmitField('F'), 'y')
+fields_case('TypeaheadField', lambda: custom.TypeaheadField('F'), 'value')
+fields_case('ReadonlyTextField', lambda: custom.ReadonlyTextField('F'),
+            'value')
+fields_case('IntervalField', lambda: custom.IntervalField('F'),
+            '0 years 0 mons 1 days 0 hours 0 mins 0 secs')
+fields_case('MacField', lambda: custom.MacField('F'), '00:de:ad:be:ef:00')
+fields_case('LazyLoadSelectField', lambda: custom.LazyLoadSelectField(
+    'F', conditions=[], data_endpoint='lazy_load', choices=[]), 'value')
+fields_case('static', lambda: custom.static(core.StringField('F')), 'value')
+fields_case('disabled', lambda: custom.disabled(core.StringField('F')),
+            'value')
+
+choices_case('SelectField', core.SelectField)
+choices_case('SelectMultipleField', core.SelectMultipleField, multiple=True)
+choices_case('RadioField', core.RadioField)
+
+
+@case('FieldList')
+def field_list_case(scale):
+    form_class = make_form('FieldList', {
+        'f': core.FieldList(core.StringField('F'), min_entries=1)})
+    formdata = MultiDict(('f-{}'.format(i), 'value') for i in range(scale))
+    return Case('FieldList', scale, form_class, formdata)
+
+
+@case('FormField')
+def form_field_case(scale):
+    row_class = make_form('Row', {
+        'a': core.StringField('A'),
+        'b': core.IntegerField('B'),
+    })
+    form_class = make_form('FormField', {
+        'f': core.FieldList(core.FormField(row_class), min_entries=1)})
+    formdata = MultiDict()
+    for i in range(scale):
+        formdata.add('f-{}-a'.format(i), 'value')
+        formdata.add('f-{}-b'.format(i), str(i))
+    return Case('FormField', scale, form_class, formdata)
+
+
+if hasattr(core, 'QuerySelectField'):
+    def query_case(name, field_class, multiple=False):
+        def builder(scale):
+            objects = [str(i) for i in range(scale)]
+            form_class = make_form(name, {'f': field_class(
+                'F', query_factory=lambda: objects, get_pk=lambda obj: obj,
+                share_choices=True)})
+            formdata = MultiDict([('f', '0')])
+            if multiple:
+                formdata.add('f', str(scale - 1))
+            return Case(name, scale, form_class, formdata)
+        return case(name)(builder)
+
+    query_case('QuerySelectField', core.QuerySelectField)
+    query_case('QuerySelectMultipleField', core.QuerySelectMultipleField,
+               multiple=True)
+
+
+def measure(func, budget):
+    """
+    Return the best time of a call of ``func`` in seconds, or the error it
+    raised.
+
+    The number of calls per repetition is doubled until a repetition takes at
+    least ``budget`` seconds, the best of three repetitions is reported.
+    """
+    try:
+        func()
+    except Exception as e:
+        return None, '{}: {}'.format(type(e).__name__, e)
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        seconds = timer.timeit(number)
+        if seconds >= budget:
+            break
+        number *= 2
+    seconds = min([seconds] + timer.repeat(repeat=2, number=number)) / number
+    return seconds, None
+
+
+def run_case(bench_case, budget):
+    form_class, formdata = bench_case.form_class, bench_case.formdata
+
+    def render(mode):
+        form = form_class(formdata=formdata)
+        form.validate()
+
+        def render_all():
+            for field in form:
+                field(render_mode=mode)
+        return render_all
+
+    processed = form_class(formdata=formdata)
+
+    steps = {
+        'bind': lambda: form_class(formdata=None),
+        'process': lambda: form_class(formdata=formdata),
+        'validate': processed.validate,
+    }
+    steps.update(('render_' + mode, render(mode)) for mode in RENDER_MODES)
+
+    results = {}
+    for step, func in steps.items():
+        try:
+            seconds, error = measure(func, budget)
+        except Exception as e:
+            seconds, error = None, '{}: {}'.format(type(e).__name__, e)
+        results[step] = {'seconds': seconds} if error is None \
+            else {'seconds': None, 'error': error}
+    return results
+
+
+def run(scales=DEFAULT_SCALES, selected=None, budget=0.02, verbose=True):
+    app = Flask(__name__)
+    app.secret_key = 'benchmark'
+    app.add_url_rule('/lazy-load', 'lazy_load', lambda: '')
+
+    results = {}
+    with app.test_request_context():
+        for name, builder in CASES:
+            if selected and name not in selected:
+                continue
+            for scale in scales:
+                key = '{}[{}]'.format(name, scale)
+                results[key] = run_case(builder(scale), budget)
+                if verbose:
+                    print(format_row(key, results[key]), flush=True)
+    return {
+        'environment': {
+            'python': platform.python_version(),
+            'flask': version('flask'),
+            'markupsafe': version('markupsafe'),
+            'wtforms': version('wtforms'),
+        },
+        'results': results,
+    }
+
+
+def format_row(key, steps):
+    cells = []
+    for step, result in steps.items():
+        seconds = result['seconds']
+        cells.append('{}={}'.format(
+            step, 'error' if seconds is None else '{:.3f}ms'.format(seconds * 1000)))
+    return '{:<34} {}'.format(key, ' '.join(cells))
+
+
+def compare(current, baseline, threshold):
+    """
+    :returns: list of ``(case, step, baseline seconds, current seconds)``
+        tuples of all steps slower by more than ``threshold``
+    """
+    regressions = []
+    for key, steps in current['results'].items():
+        for step, result in steps.items():
+            try:
+                before = baseline['results'][key][step]['seconds']
+            except KeyError:
+                continue
+            after = result['seconds']
+            if before and after and after > before * threshold:
+                regressions.append((key, step, before, after))
+    return regressions
+
+
+def find_failures(current, baseline, keys):
+    """
+    :param keys: the case keys that were run, e.g. ``'StringField[10]'``
+    :returns: list of ``(case, step, reason)`` tuples of all steps that
+        are missing compared to the baseline or raised an error without
+        having done so in the baseline
+    """
+    failures = []
+    for key in sorted(keys):
+        steps = current['results'].get(key, {})
+        before = baseline['results'].get(key, {})
+        expected = list(before) + [step for step in steps
+                                   if step not in before]
+        for step in expected:
+            result = steps.get(step)
+            if result is None:
+                failures.append((key, step, 'missing'))
+            elif (result['seconds'] is None
+                    and before.get(step, {}).get('seconds', 0) is not None):
+                failures.append((key, step, result.get('error', 'error')))
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--scales', default=','.join(map(str, DEFAULT_SCALES)),
+                        help='comma separated scales (default: %(default)s)')
+    parser.add_argument('--case', action='append', dest='cases',
+                        help='only run the given case, may be repeated')
+    parser.add_argument('--output', help='write the results to this file')
+    parser.add_argument('--baseline', help='baseline file to compare with')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='write the results to the baseline file')
+    parser.add_argument('--budget', type=float, default=0.02,
+                        help='minimal seconds per repetition '
+                             '(default: %(default)s)')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='allowed slowdown factor (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    scales = [int(scale) for scale in args.scales.split(',')]
+    current = run(scales, args.cases, args.budget)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+
+    if args.baseline and args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+    elif args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold)
+        for key, step, before, after in regressions:
+            print('REGRESSION {} {}: {:.3f}ms -> {:.3f}ms ({:.2f}x)'.format(
+                key, step, before * 1000, after * 1000, after / before))
+        keys = {'{}[{}]'.format(name, scale) for name, _ in CASES
+                if not args.cases or name in args.cases for scale in scales}
+        if not args.cases:
+            # cases removed since the baseline was saved
+            keys.update(key for key in baseline['results']
+                        if int(key.rsplit('[', 1)[1][:-1]) in scales)
+        failures = find_failures(current, baseline, keys)
+        for key, step, reason in failures:
+            print('FAILURE {} {}: {}'.format(key, step, reason))
+        if regressions or failures:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
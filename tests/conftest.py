@@ -0,0 +1,9 @@
+import pytest
+from flask import Flask
+
+
+@pytest.fixture
+def app_context():
+    """Run the test in a request context of a bare application."""
+    with Flask(__name__).test_request_context():
+        yield
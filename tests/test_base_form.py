@@ -0,0 +1,185 @@
+import pytest
+from werkzeug.datastructures import MultiDict
+from wtforms.validators import DataRequired
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields.core import FieldList, FormField, \
+    IntegerField, SelectField, StringField
+
+pytestmark = pytest.mark.usefixtures('app_context')
+
+
+class Form(BaseForm):
+    class Meta:
+        csrf = False
+
+    name = StringField('Name', [DataRequired()])
+    other = StringField('Other')
+
+
+class Lazy(BaseForm):
+    class Meta:
+        csrf = False
+
+    _lazy_binding = True
+
+    name = StringField('Name', [DataRequired()])
+    other = StringField('Other')
+    count = IntegerField('Count', default=3)
+
+    def filter_other(self, value):
+        return value.strip() if value else value
+
+
+class Eager(Lazy):
+    _lazy_binding = False
+
+
+class Obj(object):
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+def test_validate_resets_aggregated_errors():
+    form = Form(MultiDict({'name': ''}))
+    assert not form.validate()
+    form._errors = form.errors
+    form.name.data = 'name'
+    assert form.validate()
+    assert form._errors is None
+    assert form.errors == {}
+
+
+def test_validate_fields_resets_aggregated_errors():
+    form = Form(MultiDict({'name': ''}))
+    form._errors = {'other': ['stale']}
+    assert form.validate_fields(['name']) == ['name']
+    assert form._errors is None
+    assert form.errors == {'name': ['This field is required.']}
+
+
+def test_validation_result_resets_aggregated_errors():
+    class Checked(Form):
+        def validate_other(self, field):
+            # aggregates the errors while validating
+            self._errors = dict(self.errors)
+
+    form = Checked(MultiDict({'name': '', 'other': 'x'}))
+    result = form.validation_result(['name', 'other'])
+    assert result == {'valid': False, 'fields': ['name', 'other'],
+                      'errors': {'name': ['This field is required.']}}
+    assert form._errors is None
+
+
+def test_iterating_names_does_not_bind_fields():
+    form = Lazy()
+    assert list(form._fields) == ['name', 'other', 'count']
+    assert 'other' in form._fields
+    assert form._fields.bound_items() == []
+    assert form.other.data is None
+    assert [name for name, _ in form._fields.bound_items()] == ['other']
+
+
+def test_lazy_form_covers_all_fields():
+    formdata = MultiDict({'name': '', 'other': ' x ', 'count': '5'})
+    form = Lazy(formdata)
+    assert not form.validate()
+    assert form.errors == {'name': ['This field is required.']}
+    assert form.data == {'name': '', 'other': 'x', 'count': 5}
+    obj = Obj()
+    form.populate_obj(obj)
+    assert vars(obj) == {'name': '', 'other': 'x', 'count': 5}
+
+
+@pytest.mark.parametrize('args, kwargs', [
+    ((MultiDict({'name': 'form', 'other': ' late '}),), {}),
+    ((), {'obj': Obj(name='obj', other=' obj ')}),
+    ((), {'data': {'name': 'data', 'count': 7}}),
+    ((), {'other': ' kwarg ', 'count': 8}),
+    ((MultiDict({'other': ' both '}),),
+     {'obj': Obj(name='obj'), 'data': {'count': 9}}),
+])
+def test_late_bound_fields_use_last_process_arguments(args, kwargs):
+    form = Lazy(MultiDict({'name': 'first', 'other': 'first'}))
+    # bound before the second process call
+    assert form.name.data == 'first'
+    form.process(*args, **kwargs)
+    assert [name for name, _ in form._fields.bound_items()] == ['name']
+    expected = Eager(MultiDict({'name': 'first', 'other': 'first'}))
+    expected.process(*args, **kwargs)
+    # including the filter_other method
+    assert form.data == expected.data
+    assert form.other.data == expected.other.data
+
+
+def make_ordered(order):
+    class Ordered(BaseForm):
+        class Meta:
+            csrf = False
+
+        _order = order
+
+        name = StringField('Name')
+        other = StringField('Other')
+        count = IntegerField('Count')
+    return Ordered
+
+
+def test_order_moves_fields_to_the_front():
+    form = make_ordered(('count', 'other'))()
+    assert [field.name for field in form] == ['count', 'other', 'name']
+
+
+def test_unknown_names_in_order():
+    with pytest.raises(ValueError, match='Ordered._order: missing'):
+        make_ordered(('other', 'missing'))
+
+
+def test_order_set_after_class_creation():
+    Ordered = make_ordered(())
+    assert [field.name for field in Ordered()] == ['name', 'other', 'count']
+    Ordered._order = ('count',)
+    assert Ordered._unbound_fields is None
+    assert [field.name for field in Ordered()] == ['count', 'name', 'other']
+    Ordered._order = ('missing',)
+    with pytest.raises(ValueError):
+        Ordered()
+
+
+class Address(BaseForm):
+    class Meta:
+        csrf = False
+
+    street = StringField('Street', [DataRequired()])
+    numbers = FieldList(StringField('Number'), min_entries=2)
+
+
+class Person(BaseForm):
+    class Meta:
+        csrf = False
+
+    name = StringField('Name <b>', [DataRequired()], description='& more')
+    kind = SelectField('Kind', choices=[('a', 'A'), ('b', 'B<')])
+    address = FormField(Address)
+    addresses = FieldList(FormField(Address), min_entries=2,
+                          render_kw={'data-role': 'list'})
+    tags = FieldList(StringField('Tag'), min_entries=1)
+
+
+class CustomRendering(Person):
+    class Meta:
+        def render_field(self, field, render_kw):
+            return '<custom {}>'.format(field.name)
+
+
+@pytest.mark.parametrize('form_class', [Person, CustomRendering])
+@pytest.mark.parametrize('render_mode', ['basic', 'horizontal', 'inline'])
+def test_iter_render_equals_rendering_all_fields(form_class, render_mode):
+    form = form_class(MultiDict({'addresses-1-street': 'x',
+                                 'addresses-1-numbers-0': '1'}))
+    form.validate()
+    chunks = list(form.iter_render(render_mode=render_mode))
+    # a custom render_field is called once per top-level field
+    assert (len(chunks) > len(form._fields)) == (form_class is Person)
+    assert ''.join(chunks) == ''.join(
+        str(field(render_mode=render_mode)) for field in form)
@@ -0,0 +1,30 @@
+from benchmarks.suite import find_failures
+
+
+def results(**steps):
+    return {'results': {'StringField[1]': steps}}
+
+
+def test_erroring_and_missing_steps_fail():
+    baseline = results(bind={'seconds': 0.1}, render_basic={'seconds': 0.1},
+                       validate={'seconds': 0.1})
+    current = results(bind={'seconds': 0.1},
+                      render_basic={'seconds': None, 'error': 'KeyError: x'})
+    assert find_failures(current, baseline, ['StringField[1]']) == [
+        ('StringField[1]', 'render_basic', 'KeyError: x'),
+        ('StringField[1]', 'validate', 'missing'),
+    ]
+
+
+def test_removed_case_fails():
+    baseline = {'results': {'Removed[1]': {'bind': {'seconds': 0.1}}}}
+    assert find_failures(results(), baseline, ['Removed[1]']) == [
+        ('Removed[1]', 'bind', 'missing'),
+    ]
+
+
+def test_known_errors_pass():
+    error = {'seconds': None, 'error': 'KeyError: x'}
+    assert find_failures(results(render_inline=error),
+                         results(render_inline=error),
+                         ['StringField[1]']) == []
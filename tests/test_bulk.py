@@ -0,0 +1,109 @@
+import pytest
+from werkzeug.datastructures import MultiDict
+from wtforms.validators import DataRequired, Length, NumberRange, \
+    ValidationError
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.bulk import is_bulk_validatable
+from wtforms_widgets.fields.core import FieldList, FormField, IntegerField, \
+    SelectField, StringField
+from wtforms_widgets.fields.validators import MacAddress, OptionalIf
+
+pytestmark = pytest.mark.usefixtures('app_context')
+
+
+class Row(BaseForm):
+    class Meta:
+        csrf = False
+
+    name = StringField('Name', [DataRequired(), Length(max=8)])
+    mac = StringField('MAC', [MacAddress()])
+    alias = StringField('Alias', [MacAddress(normalize=True)])
+    building = SelectField('Building', choices=[('1', 'Wu 1'), ('2', 'Wu 3')])
+    port = IntegerField('Port', [NumberRange(min=1)])
+    comment = StringField('Comment', [OptionalIf('name')])
+
+    def validate_comment(self, field):
+        if field.data == 'bad':
+            raise ValidationError("Bad comment")
+
+
+class BulkImport(BaseForm):
+    class Meta:
+        csrf = False
+
+    rows = FieldList(FormField(Row), bulk_validation=True)
+
+
+class SerialImport(BaseForm):
+    class Meta:
+        csrf = False
+
+    rows = FieldList(FormField(Row), bulk_validation=False)
+
+
+VALID = {
+    'name': 'host',
+    'mac': '00:de:ad:be:ef:00',
+    'alias': '00-DE-AD-BE-EF-01',
+    'building': '1',
+    'port': '22',
+    'comment': 'ok',
+}
+
+# every row but the first and the last is wrong in exactly one column
+ROWS = [
+    {},
+    {'name': ''},
+    {'name': 'much too long'},
+    {'mac': 'zz'},
+    {'alias': 'zz'},
+    {'building': '3'},
+    {'port': 'x'},
+    {'port': '0'},
+    {'comment': 'bad'},
+    {'name': '', 'comment': ''},
+]
+
+
+def formdata(rows):
+    data = MultiDict()
+    for i, row in enumerate(rows):
+        for name, value in dict(VALID, **row).items():
+            data.add('rows-{}-{}'.format(i, name), value)
+    return data
+
+
+def result(form_class, rows):
+    form = form_class(formdata(rows))
+    return (form.validate(), form.errors, form.data,
+            [[(field.name, field.errors) for field in entry.form]
+             for entry in form.rows])
+
+
+def test_bulk_validation_equals_serial_validation():
+    serial = result(SerialImport, ROWS)
+    assert result(BulkImport, ROWS) == serial
+    valid, _, _, errors = serial
+    assert not valid
+    assert not any(field_errors for _, field_errors in errors[0])
+    assert all(sum(bool(field_errors) for _, field_errors in row) == 1
+               for row in errors[1:-1])
+
+
+def test_rows_are_validated_column_by_column():
+    form = BulkImport(formdata(ROWS))
+    assert is_bulk_validatable(form.rows.entries)
+
+
+@pytest.mark.parametrize('row', ROWS)
+def test_single_row_errors_equal_serial_validation(row):
+    rows = [{}, row, {}]
+    assert result(BulkImport, rows) == result(SerialImport, rows)
+
+
+def test_normalized_data_equals_serial_validation():
+    rows = [{'alias': '00DEADBEEF{:02X}'.format(i)} for i in range(5)]
+    serial = result(SerialImport, rows)
+    assert serial[0]
+    assert result(BulkImport, rows) == serial
@@ -0,0 +1,158 @@
+import os
+import subprocess
+import sys
+import threading
+from functools import partial
+
+import pytest
+from wtforms.widgets import TextInput
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.cache import LRURenderCacheBackend, RenderCache, \
+    widget_identity
+from wtforms_widgets.fields.core import BooleanField, StringField
+from wtforms_widgets.fields.custom import cached, disabled, static
+from wtforms_widgets.widgets import WidgetDecorator, decorate
+
+pytestmark = pytest.mark.usefixtures('app_context')
+
+
+class AddClass(WidgetDecorator):
+    __slots__ = ('class_',)
+
+    def __init__(self, widget, class_):
+        super(AddClass, self).__init__(widget)
+        self.class_ = class_
+
+    def __call__(self, field, **kwargs):
+        kwargs['class_'] = self.class_
+        return self.widget(field, **kwargs)
+
+
+def render_input(field, **kwargs):
+    return field.name
+
+
+def test_identity_contains_state_of_all_layers():
+    widget = TextInput()
+    assert (widget_identity(AddClass(widget, 'a'))
+            != widget_identity(AddClass(widget, 'b')))
+    assert (widget_identity(decorate(partial(render_input, kind='a')))
+            != widget_identity(decorate(partial(render_input, kind='b'))))
+
+
+def test_identity_rejects_unstable_state():
+    with pytest.raises(TypeError):
+        widget_identity(AddClass(TextInput(), object()))
+
+
+def make_form(cache):
+    class Form(BaseForm):
+        class Meta:
+            csrf = False
+
+        login = cached(static(StringField('Login')), cache)
+        other = cached(disabled(StringField('Login')), cache)
+    return Form
+
+
+def key():
+    form = make_form(RenderCache())(data={'login': 'admin'})
+    field = form.login
+    return RenderCache.key(field.widget.identity, field, {})
+
+
+def test_keys_are_stable_across_processes():
+    script = (
+        'from flask import Flask\n'
+        'from tests.test_cache import key\n'
+        'with Flask(__name__).test_request_context():\n'
+        '    print(key())\n'
+    )
+    keys = {
+        subprocess.check_output(
+            [sys.executable, '-c', script],
+            env=dict(os.environ, PYTHONHASHSEED=seed),
+            cwd=os.path.dirname(os.path.dirname(__file__)),
+        ).strip()
+        for seed in ('1', '2')
+    }
+    assert len(keys) == 1
+    assert keys == {key().encode()}
+
+
+def test_render_cache_hits_and_keeps_fields_apart():
+    cache = RenderCache()
+    form = make_form(cache)(data={'login': 'admin', 'other': 'admin'})
+    html = str(form.login())
+    assert str(form.login()) == html
+    assert 'disabled' in str(form.other())
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_checked_and_unchecked_boolean_fields_differ():
+    cache = RenderCache()
+
+    class Form(BaseForm):
+        class Meta:
+            csrf = False
+
+        active = cached(disabled(BooleanField('Active')), cache)
+
+    unchecked = str(Form(data={'active': False}).active())
+    checked = str(Form(data={'active': True}).active())
+    assert 'checked' not in unchecked
+    assert 'checked' in checked
+    assert str(Form(data={'active': False}).active()) == unchecked
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_unstable_state_is_rendered_without_cache():
+    cache = RenderCache()
+    form = make_form(cache)(data={'login': 'admin'})
+    assert 'object' in str(form.login(data_object=object()))
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_query_choices_are_part_of_the_key():
+    pytest.importorskip('wtforms_sqlalchemy')
+    from wtforms_widgets.fields.query import QuerySelectField
+
+    rooms = ['1', '2']
+    cache = RenderCache()
+
+    class Form(BaseForm):
+        class Meta:
+            csrf = False
+
+        room = cached(disabled(QuerySelectField(
+            'Room', query_factory=lambda: list(rooms),
+            get_pk=lambda room: room)), cache)
+
+    assert 'value="3"' not in str(Form().room())
+    rooms.append('3')
+    assert 'value="3"' in str(Form().room())
+    assert cache.misses == 2
+
+
+def test_lru_backend_is_thread_safe():
+    backend = LRURenderCacheBackend(maxsize=8)
+    errors = []
+
+    def run(offset):
+        try:
+            for i in range(5000):
+                key = (i + offset) % 16
+                if backend.get(key) is None:
+                    backend.set(key, str(key))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(offset,))
+               for offset in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert len(backend) <= 8
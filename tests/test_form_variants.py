@@ -0,0 +1,48 @@
+import pytest
+from wtforms.widgets import PasswordInput
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields.core import BooleanField, FileField, \
+    PasswordField, StringField
+from wtforms_widgets.fields.custom import disabled_form, static_form
+
+
+class Account(BaseForm):
+    class Meta:
+        csrf = False
+
+    login = StringField('Login')
+    password = PasswordField('Password')
+    shown = PasswordField('Shown', widget=PasswordInput(hide_value=False))
+
+
+@pytest.mark.parametrize('variant', [static_form, disabled_form])
+def test_variants_hide_passwords(app_context, variant):
+    form = variant(Account)(data={'login': 'admin', 'password': 'secret',
+                                  'shown': 'secret'})
+    html = ''.join(str(field()) for field in form)
+    assert 'admin' in html
+    assert 'secret' not in html
+    assert str(form.password()).count('disabled') == 1
+
+
+def test_static_form_is_cached(app_context):
+    assert static_form(Account) is static_form(Account)
+    assert list(static_form(Account)()._fields) == list(Account()._fields)
+
+
+@pytest.mark.parametrize('variant', [static_form, disabled_form])
+def test_variants_disable_fields_without_text_value(app_context, variant):
+    class Upload(BaseForm):
+        class Meta:
+            csrf = False
+
+        name = StringField('Name')
+        document = FileField('Document')
+        active = BooleanField('Active')
+
+    form = variant(Upload)(data={'name': 'a', 'active': True})
+    assert 'disabled' in str(form.document())
+    assert 'type="file"' in str(form.document())
+    html = str(form.active())
+    assert 'disabled' in html and 'checked' in html
@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+OPTIONAL = ('flask', 'jinja2', 'sqlalchemy', 'wtforms_sqlalchemy')
+
+
+def imported_optional_modules(module):
+    script = (
+        'import sys, {0}\n'
+        'print(" ".join(m for m in {1!r} if m in sys.modules))\n'
+    ).format(module, OPTIONAL)
+    return subprocess.check_output(
+        [sys.executable, '-c', script],
+        cwd=os.path.dirname(os.path.dirname(__file__)),
+        text=True,
+    ).split()
+
+
+@pytest.mark.parametrize('module', [
+    'wtforms_widgets',
+    'wtforms_widgets.widgets',
+    'wtforms_widgets.renderers',
+    'wtforms_widgets.fields',
+    'wtforms_widgets.fields.core',
+    'wtforms_widgets.fields.custom',
+])
+def test_optional_integrations_are_not_imported(module):
+    assert imported_optional_modules(module) == []
@@ -0,0 +1,80 @@
+import io
+import threading
+
+from flask import Flask
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields.core import StringField
+from wtforms_widgets.instrumentation import Profile, add_hook, profile, \
+    remove_hook, scoped_hook
+
+
+class Form(BaseForm):
+    class Meta:
+        csrf = False
+
+    name = StringField('Name')
+    other = StringField('Other')
+
+
+def render(form, *names):
+    return [form[name]() for name in names]
+
+
+def test_profile_records_only_current_thread():
+    app = Flask(__name__)
+    started = threading.Barrier(2)
+    done = threading.Barrier(2)
+    profiles = {}
+
+    def run(name):
+        with app.test_request_context():
+            form = Form()
+            with profile(io.StringIO()) as hook:
+                started.wait()
+                render(form, name)
+                done.wait()
+            profiles[name] = hook
+
+    threads = [threading.Thread(target=run, args=(name,))
+               for name in ('name', 'other')]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert set(profiles['name'].render_by_field) == {'name'}
+    assert set(profiles['other'].render_by_field) == {'other'}
+
+
+def test_overlapping_profiles_keep_recording():
+    app = Flask(__name__)
+    with app.test_request_context():
+        form = Form()
+        outer = Profile()
+        with scoped_hook(outer):
+            with profile(io.StringIO()) as inner:
+                render(form, 'name')
+            render(form, 'other')
+        render(form, 'name')
+    assert set(inner.render_by_field) == {'name'}
+    # every layer of the widget chain counts as call
+    layers = inner.render_by_field['name'].calls
+    assert outer.render_by_field['name'].calls == layers
+    assert outer.render_by_field['other'].calls == layers
+
+
+def test_global_hook_receives_all_threads():
+    app = Flask(__name__)
+    hook = Profile()
+    add_hook(hook)
+    try:
+        def run():
+            with app.test_request_context():
+                render(Form(), 'other')
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+    finally:
+        remove_hook(hook)
+    assert set(hook.render_by_field) == {'other'}
+    assert hook.render_by_widget
@@ -0,0 +1,35 @@
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from werkzeug.datastructures import MultiDict
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields.custom import Interval, IntervalField
+
+pytestmark = pytest.mark.usefixtures('app_context')
+
+
+class Form(BaseForm):
+    class Meta:
+        csrf = False
+
+    interval = IntervalField('Interval')
+
+
+def test_populate_obj_stores_picker_format():
+    text = '0 years 1 mons 2 days 3 hours 4 mins 5 secs'
+    form = Form(MultiDict({'interval': text}))
+    assert form.validate()
+    assert form.interval.data == Interval(0, 1, 2, 3, 4, 5)
+    obj = SimpleNamespace()
+    form.populate_obj(obj)
+    assert obj.interval == text
+
+
+def test_populate_obj_from_timedelta():
+    form = Form(obj=SimpleNamespace(interval=timedelta(days=1, seconds=61)))
+    obj = SimpleNamespace()
+    form.populate_obj(obj)
+    assert obj.interval == '0 years 0 mons 1 days 0 hours 1 mins 1 secs'
+    assert form.interval.data.to_timedelta() == timedelta(days=1, seconds=61)
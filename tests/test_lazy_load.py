@@ -0,0 +1,178 @@
+import flask
+import pytest
+from flask import Flask
+from werkzeug.datastructures import MultiDict
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields.custom import LazyLoadSelectField
+from wtforms_widgets.lazy_load import MAX_LIMIT, lazy_load_response, paginate
+from wtforms_widgets.widgets import endpoint_url
+
+
+class Form(BaseForm):
+    class Meta:
+        csrf = False
+
+    building = LazyLoadSelectField('Building', conditions=[],
+                                   data_endpoint='buildings', choices=[])
+    level = LazyLoadSelectField('Level', conditions=['building'],
+                                data_endpoint='levels', choices=[])
+    room = LazyLoadSelectField('Room', conditions=['building', 'level'],
+                               data_endpoint='levels', choices=[])
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.add_url_rule('/buildings', 'buildings', lambda: '')
+    app.add_url_rule('/levels', 'levels', lambda: '')
+    return app
+
+
+@pytest.fixture
+def url_for_calls(monkeypatch):
+    calls = []
+    url_for = flask.url_for
+
+    def counting_url_for(endpoint, **values):
+        calls.append(endpoint)
+        return url_for(endpoint, **values)
+
+    monkeypatch.setattr(flask, 'url_for', counting_url_for)
+    return calls
+
+
+def render(form):
+    return [str(field()) for field in form]
+
+
+def test_url_for_is_called_once_per_endpoint_and_request(app, url_for_calls):
+    lookups = endpoint_url.lookups
+    with app.test_request_context():
+        html = render(Form()) + render(Form())
+        assert sorted(url_for_calls) == ['buildings', 'levels']
+    assert 'data-url="/buildings"' in html[0]
+    assert all('data-url="/levels"' in field_html for field_html in html[1:3])
+    with app.test_request_context():
+        render(Form())
+    assert len(url_for_calls) == 4
+    assert endpoint_url.lookups - lookups == 4
+
+
+def test_cached_urls_equal_url_for(app):
+    with app.test_request_context():
+        html = render(Form())
+        expected = [flask.url_for(field.data_endpoint) for field in Form()]
+    assert all('data-url="{}"'.format(url) in field_html
+               for url, field_html in zip(expected, html))
+
+
+ROOMS = ['{:02d}'.format(i) for i in range(25)]
+
+
+class Query(object):
+    """Records the slices requested like a SQLAlchemy query."""
+
+    def __init__(self, items, calls):
+        self.items = items
+        self.calls = calls
+
+    def offset(self, offset):
+        self.calls.append(('offset', offset))
+        return Query(self.items[offset:], self.calls)
+
+    def limit(self, limit):
+        self.calls.append(('limit', limit))
+        return Query(self.items[:limit], self.calls)
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+def test_pages_follow_next_cursor():
+    pages = [paginate(ROOMS, limit=10)]
+    while pages[-1]['has_more']:
+        pages.append(paginate(ROOMS, limit=10,
+                              cursor=pages[-1]['next_cursor']))
+    assert [page['next_cursor'] for page in pages] == ['10', '20', None]
+    assert [item for page in pages for item in page['items']] == ROOMS
+
+
+def test_cursor_takes_precedence_over_offset():
+    assert paginate(ROOMS, offset=3, limit=2, cursor='20')['items'] \
+        == ['20', '21']
+    assert paginate(ROOMS, offset=3, limit=2)['items'] == ['03', '04']
+
+
+@pytest.mark.parametrize('limit, size', [(0, 1), (-5, 1), (10 ** 6, 25)])
+def test_page_size_is_capped(limit, size):
+    page = paginate(ROOMS, limit=limit)
+    assert len(page['items']) == size
+    assert page['has_more'] == (size < len(ROOMS))
+
+
+def test_query_is_sliced_with_one_extra_item():
+    calls = []
+    page = paginate(Query(ROOMS, calls), offset=20, limit=MAX_LIMIT + 1)
+    assert calls == [('offset', 20), ('limit', MAX_LIMIT + 1)]
+    assert page == {'items': ROOMS[20:], 'next_cursor': None,
+                    'has_more': False}
+
+
+def test_search():
+    page = paginate([('1', 'Wu 1'), ('2', 'Wu 3'), ('3', 'Zw 41')], q='wu')
+    assert page['items'] == [('1', 'Wu 1'), ('2', 'Wu 3')]
+    with pytest.raises(ValueError, match='search function'):
+        paginate(Query(ROOMS, []), q='1')
+
+
+def test_invalid_cursor():
+    with pytest.raises(ValueError, match='Invalid cursor: x'):
+        paginate(ROOMS, cursor='x')
+
+
+def test_lazy_load_response(app):
+    with app.test_request_context('/?q=1&limit=3&cursor=3'):
+        response = lazy_load_response(ROOMS)
+    assert response.get_json() == {'items': ['12', '13', '14'],
+                                   'next_cursor': '6', 'has_more': True}
+    with app.test_request_context('/?cursor=x'):
+        response = lazy_load_response(ROOMS)
+    assert response.status_code == 400
+
+
+def test_page_size_is_rendered(app):
+    class Paged(BaseForm):
+        class Meta:
+            csrf = False
+
+        room = LazyLoadSelectField('Room', conditions=[], choices=[],
+                                   data_endpoint='levels', page_size=20)
+
+    with app.test_request_context():
+        assert 'data-page-size="20"' in str(Paged().room())
+        assert 'data-page-size' not in str(Form().room())
+
+
+class Checked(BaseForm):
+    class Meta:
+        csrf = False
+
+    building = LazyLoadSelectField('Building', conditions=[], choices=[],
+                                   data_endpoint='buildings')
+    room = LazyLoadSelectField(
+        'Room', conditions=['building'], choices=[], data_endpoint='levels',
+        choice_exists=lambda form, value:
+            value.startswith(form.building.data + '-'))
+
+
+@pytest.mark.parametrize('room, errors', [
+    ('1-01', []),
+    ('2-01', ['Not a valid choice.']),
+])
+def test_choice_exists(app, room, errors):
+    with app.test_request_context():
+        form = Checked(MultiDict({'building': '1', 'room': room}))
+        form.validate()
+        assert form.room.errors == errors
+        assert form.errors.get('building') is None
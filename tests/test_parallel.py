@@ -0,0 +1,93 @@
+import copyreg
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from werkzeug.datastructures import MultiDict
+from wtforms.validators import DataRequired, Length, Optional
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields.core import BooleanField, FieldList, FormField, \
+    SelectField, StringField
+from wtforms_widgets.fields.validators import MacAddress, OptionalIf
+from wtforms_widgets.parallel import validate_entries
+
+
+class Row(BaseForm):
+    class Meta:
+        csrf = False
+
+    name = StringField('Name', [DataRequired(), Length(max=8)])
+    mac = StringField('MAC', [MacAddress(normalize=True)])
+    building = SelectField('Building', choices=[('1', 'Wu 1'), ('2', 'Wu 3')])
+    comment = StringField('Comment', [OptionalIf('name')], default='none')
+    active = BooleanField('Active')
+
+
+class Import(BaseForm):
+    class Meta:
+        csrf = False
+
+    _parallel_threshold = 2
+    _parallel_chunk_size = 3
+
+    rows = FieldList(FormField(Row))
+
+
+def formdata(count=10):
+    data = MultiDict()
+    for i in range(count):
+        data.add('rows-{}-name'.format(i), '' if i % 3 == 0 else 'host{}'.format(i))
+        data.add('rows-{}-mac'.format(i),
+                 'zz' if i % 4 == 0 else '00-DE-AD-BE-EF-{:02X}'.format(i))
+        data.add('rows-{}-building'.format(i), '3' if i % 5 == 0 else '1')
+        if i % 2:
+            data.add('rows-{}-comment'.format(i), 'comment')
+            data.add('rows-{}-active'.format(i), 'y')
+    return data
+
+
+def result(form):
+    return (form.errors, form.data,
+            [[field.errors for field in entry.form] for entry in form.rows])
+
+
+@pytest.fixture(scope='module')
+def executor():
+    with ProcessPoolExecutor(2) as executor:
+        yield executor
+
+
+def test_parallel_validation_equals_serial(app_context, executor):
+    data = formdata()
+    serial = Import(formdata=data)
+    parallel = Import(formdata=data)
+    assert serial.validate() is parallel.validate(executor=executor) is False
+    assert result(parallel) == result(serial)
+    # normalized by MacAddress in the worker
+    assert parallel.rows[1].mac.data == '00:de:ad:be:ef:01'
+
+
+def test_entries_are_offloaded(app_context, executor):
+    form = Import(formdata=formdata())
+    assert validate_entries(executor, form.rows.entries, 3)
+    form.rows.append_entry()
+    assert not validate_entries(executor, form.rows.entries, 3)
+
+
+def test_revalidation_resets_errors(app_context, executor):
+    form = Import(formdata=formdata())
+    assert not form.validate(executor=executor)
+    for entry in form.rows:
+        entry.form.name.data = 'host'
+        entry.form.mac.data = '00:de:ad:be:ef:00'
+        entry.form.building.data = '1'
+    form.rows.append_entry()
+    # the appended entry has no form data, the list is validated serially
+    assert not form.validate(executor=executor)
+    assert [entry.errors for entry in form.rows[:-1]] == [{}] * 10
+    assert 'name' in form.rows[-1].errors
+
+
+def test_validators_keep_default_pickling():
+    assert Optional not in copyreg.dispatch_table
+    assert OptionalIf not in copyreg.dispatch_table
@@ -0,0 +1,175 @@
+import pytest
+from flask import Flask
+
+pytest.importorskip('wtforms_sqlalchemy')
+
+from wtforms_widgets.base_form import BaseForm  # noqa: E402
+from wtforms_widgets.fields.query import QuerySelectField, \
+    invalidate_choices  # noqa: E402
+
+rooms = ['1', '2']
+calls = []
+
+
+def query_rooms():
+    calls.append(1)
+    return list(rooms)
+
+
+def make_form(**kwargs):
+    class Form(BaseForm):
+        class Meta:
+            csrf = False
+
+        room = QuerySelectField('Room', query_factory=query_rooms,
+                                get_pk=lambda room: room, **kwargs)
+    return Form
+
+
+@pytest.fixture
+def app():
+    del calls[:]
+    return Flask(__name__)
+
+
+def test_choices_are_not_shared_by_default(app):
+    form_class = make_form()
+    with app.test_request_context():
+        form_class().room()
+        form_class().room()
+    assert len(calls) == 2
+
+
+def test_shared_choices_are_scoped_to_the_request(app):
+    form_class = make_form(share_choices=True)
+    with app.app_context():
+        with app.test_request_context():
+            form_class().room()
+            form_class().room()
+        assert len(calls) == 1
+        with app.test_request_context():
+            form_class().room()
+        assert len(calls) == 2
+        # outside of requests nothing is shared
+        form_class().room()
+        form_class().room()
+        assert len(calls) == 4
+
+
+def test_invalidate_choices(app):
+    form_class = make_form(share_choices=True)
+    with app.test_request_context():
+        form_class().room()
+        rooms.append('3')
+        try:
+            invalidate_choices(query_rooms)
+            assert 'value="3"' in str(form_class().room())
+        finally:
+            rooms.remove('3')
+    assert len(calls) == 2
+
+
+class Room(object):
+    def __init__(self, pk, name):
+        self.pk = pk
+        self.name = name
+
+
+def test_shared_options_include_labels(app):
+    objects = [Room('1', 'Wu 1'), Room('2', 'Wu 3')]
+
+    class Form(BaseForm):
+        class Meta:
+            csrf = False
+
+        by_name = QuerySelectField(
+            'Room', query_factory=lambda: objects, options_key='rooms',
+            get_pk=lambda room: room.pk, get_label='name')
+        by_pk = QuerySelectField(
+            'Room', query_factory=lambda: objects, options_key='rooms',
+            get_pk=lambda room: room.pk, get_label='pk')
+
+    with app.test_request_context():
+        assert '>Wu 1<' in str(Form().by_name())
+        assert '>Wu 1<' not in str(Form().by_pk())
+        objects[0].name = 'Wu 5'
+        html = str(Form().by_name())
+    assert '>Wu 5<' in html
+    assert '>Wu 1<' not in html
+
+
+def test_load_choices_from_sqlite(app):
+    pytest.importorskip('aiosqlite')
+    import asyncio
+
+    from sqlalchemy import Column, Integer, String, event, select
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.orm import declarative_base
+    from sqlalchemy.pool import StaticPool
+    from werkzeug.datastructures import MultiDict
+
+    from wtforms_widgets.fields.query import QuerySelectMultipleField
+
+    Base = declarative_base()
+
+    class Building(Base):
+        __tablename__ = 'building'
+        id = Column(Integer, primary_key=True)
+        name = Column(String)
+
+    engine = create_async_engine('sqlite+aiosqlite://',
+                                 poolclass=StaticPool)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    queries = []
+    event.listen(engine.sync_engine, 'before_cursor_execute',
+                 lambda *args: queries.append(args[2]))
+
+    async def query_buildings():
+        async with session_factory() as session:
+            return (await session.scalars(
+                select(Building).order_by(Building.id))).all()
+
+    async def query_first():
+        return (await query_buildings())[:1]
+
+    class Form(BaseForm):
+        class Meta:
+            csrf = False
+
+        building = QuerySelectField(
+            'Building', async_query_factory=query_buildings, share_choices=True,
+            get_label='name')
+        buildings = QuerySelectMultipleField(
+            'Buildings', async_query_factory=query_buildings, share_choices=True,
+            get_label='name')
+        other = QuerySelectField(
+            'Other', async_query_factory=query_first,
+            share_choices=True, get_label='name')
+
+    async def setup():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        async with session_factory() as session:
+            session.add_all([Building(id=1, name='Wu 1'),
+                             Building(id=2, name='Wu 3')])
+            await session.commit()
+
+    asyncio.run(setup())
+    formdata = MultiDict([('building', '2'), ('buildings', '1'),
+                          ('buildings', '2'), ('other', '1')])
+    with app.test_request_context():
+        del queries[:]
+        form = Form(formdata)
+        asyncio.run(form.load_choices())
+        # one query per shared key, run concurrently
+        assert len(queries) == 2
+        assert form.validate()
+        assert form.building.data.name == 'Wu 3'
+        assert [b.name for b in form.buildings.data] == ['Wu 1', 'Wu 3']
+        assert 'Wu 3' in str(form.building())
+        # forms bound later in the request use the shared lists
+        second = Form(formdata)
+        assert second.validate()
+        assert '>Wu 1<' in str(second.other())
+        assert len(queries) == 2
+    asyncio.run(engine.dispose())
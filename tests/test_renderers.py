@@ -0,0 +1,82 @@
+import functools
+
+import pytest
+from werkzeug.datastructures import MultiDict
+from wtforms.validators import DataRequired
+from wtforms.widgets import TextInput
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields import core, custom
+from wtforms_widgets.renderers import JinjaRenderer, StringRenderer, \
+    get_renderer
+from wtforms_widgets.widgets import BootstrapStandardDecorator, decorate
+
+pytestmark = pytest.mark.usefixtures('app_context')
+
+
+class Sub(BaseForm):
+    class Meta:
+        csrf = False
+
+    a = core.StringField('A <b>', description='desc & more')
+
+
+class Form(BaseForm):
+    class Meta:
+        csrf = False
+
+    select = core.SelectField('Sel', choices=[('a', 'A&'), ('b', 'B')])
+    multiple = core.SelectMultipleField('Multi', choices=[('a', 'A')])
+    radio = core.RadioField('Radio', choices=[('x', 'X'), ('y', 'Y<')])
+    string = core.StringField('Str"', [DataRequired()], description='<help>')
+    integer = core.IntegerField('Int')
+    money = core.MoneyField('Money')
+    boolean = core.BooleanField('Bool & co')
+    text = core.TextAreaField('Text')
+    items = core.FieldList(core.StringField('Item'), min_entries=2)
+    sub = core.FormField(Sub)
+    mac = custom.MacField('Mac')
+    readonly = custom.ReadonlyTextField('RO', default='ro')
+
+
+def render(field, mode):
+    try:
+        return str(field(render_mode=mode, class_='a  b'))
+    except TypeError:
+        # MacField passes its own placeholder in inline mode
+        return 'TypeError'
+
+
+def render_all(renderer):
+    Form.Meta.renderer = renderer
+    try:
+        form = Form(MultiDict({'x&"<y>-string': '', 'x&"<y>-integer': 'x',
+                               'x&"<y>-money': '1,5', 'x&"<y>-mac': 'zz'}),
+                    prefix='x&"<y>')
+        form.validate()
+        return [render(field, mode)
+                for mode in ('basic', 'horizontal', 'inline')
+                for field in form]
+    finally:
+        del Form.Meta.renderer
+
+
+def test_renderers_produce_identical_markup():
+    expected = render_all(StringRenderer())
+    assert render_all(JinjaRenderer()) == expected
+    assert any('form-group-x&amp;&#34;&lt;y&gt;-string' in html
+               for html in expected)
+
+
+def test_renderer_bound_at_decoration():
+    renderer = JinjaRenderer()
+    widget = decorate(TextInput(),
+                      functools.partial(BootstrapStandardDecorator,
+                                        renderer=renderer))
+    assert widget.renderer is renderer
+    assert widget.renderer_for(Form().string) is renderer
+    assert core.StringField.widget.renderer is None
+
+
+def test_default_renderer_without_app_renderers():
+    assert type(get_renderer(Form().string)) is StringRenderer
@@ -0,0 +1,60 @@
+import pytest
+import wtforms
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.cache import option_blocks
+from wtforms_widgets.choices import choice_sets
+from wtforms_widgets.fields.core import SelectField, SelectMultipleField
+
+pytestmark = pytest.mark.usefixtures('app_context')
+
+
+def form_class(field_class, choices, **kwargs):
+    class Form(BaseForm):
+        class Meta:
+            csrf = False
+
+        field = field_class('Field', choices=choices, **kwargs)
+    return Form
+
+
+def plain(field_class, field):
+    widget = wtforms.widgets.Select(
+        multiple=issubclass(field_class, SelectMultipleField))
+    return str(widget(field, class_='form-control'))
+
+
+def shared(field):
+    return str(field.widget.widget.widget.widget(field, class_='form-control'))
+
+
+@pytest.mark.parametrize('field_class, data', [
+    (SelectField, '2'),
+    (SelectMultipleField, ['1', '3']),
+])
+def test_shared_block_equals_plain_select(field_class, data):
+    choices = [('1', 'a'), ('2', 'b<'), ('3', 'c', {'disabled': True})]
+    form = form_class(field_class, choices, options_key='letters')(
+        data={'field': data})
+    assert shared(form.field) == plain(field_class, form.field)
+    # rendered again from the cached block
+    assert shared(form.field) == plain(field_class, form.field)
+
+
+def test_choice_set_equals_plain_select():
+    choices = choice_sets.register('test-letters', [('1', 'a'), ('2', 'b')])
+    form = form_class(SelectField, choices)(data={'field': '2'})
+    assert form.field.options_key is not None
+    assert shared(form.field) == plain(SelectField, form.field)
+
+
+def test_same_key_different_choices():
+    option_blocks.clear()
+    first = form_class(SelectField, [('a', 'A'), ('b', 'B')],
+                       options_key='same')()
+    second = form_class(SelectField, [('1', 'other')], options_key='same')()
+    assert 'other' not in str(first.field())
+    html = str(second.field())
+    assert 'other' in html
+    assert 'value="a"' not in html
+    assert shared(second.field) == plain(SelectField, second.field)
@@ -0,0 +1,47 @@
+import pytest
+from flask import Flask
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields.core import StringField
+from wtforms_widgets.validation import validation_view
+
+
+class Form(BaseForm):
+    class Meta:
+        csrf = False
+
+    login = StringField('Login')
+    broken = StringField('Broken')
+
+    def validate_broken(self, field):
+        raise ValueError('internal detail')
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.testing = True
+    app.add_url_rule('/validate', 'validate', validation_view(Form),
+                     methods=['POST'])
+    return app.test_client()
+
+
+def test_validates_named_fields(client):
+    response = client.post('/validate?field=login', data={'login': 'a'})
+    assert response.get_json() == {'valid': True, 'fields': ['login'],
+                                   'errors': {}}
+
+
+@pytest.mark.parametrize('query, error', [
+    ('', 'No field given'),
+    ('?field=login&field=unknown', 'Unknown fields: unknown'),
+])
+def test_bad_requests(client, query, error):
+    response = client.post('/validate' + query)
+    assert response.status_code == 400
+    assert response.get_json() == {'error': error}
+
+
+def test_validator_errors_propagate(client):
+    with pytest.raises(ValueError, match='internal detail'):
+        client.post('/validate?field=broken')
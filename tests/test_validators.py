@@ -0,0 +1,91 @@
+import pytest
+from werkzeug.datastructures import MultiDict
+
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields.custom import MacField
+from wtforms_widgets.fields.validators import MacAddress, normalize_mac, \
+    normalize_many
+
+CANONICAL = '00:de:ad:be:ef:0a'
+
+pytestmark = pytest.mark.usefixtures('app_context')
+
+
+class Form(BaseForm):
+    class Meta:
+        csrf = False
+
+    mac = MacField('MAC', [MacAddress(normalize=True)])
+    strict = MacField('MAC', [MacAddress()])
+
+
+ACCEPTED = [
+    '00:de:ad:be:ef:0a',
+    '00:DE:AD:BE:EF:0A',
+    '00-de-ad-be-ef-0a',
+    '00-DE-AD-BE-EF-0A',
+    '00de.adbe.ef0a',
+    '00DE.ADBE.EF0A',
+    '00deadbeef0a',
+    '00DEADBEEF0A',
+    '00:De:aD:bE:Ef:0A',
+]
+
+REJECTED = [
+    None,
+    '',
+    'zz',
+    '00:de:ad:be:ef',
+    '00:de:ad:be:ef:0a:00',
+    '00:de-ad:be:ef:0a',
+    '00.de.ad.be.ef.0a',
+    '00:de:ad:be:ef:0g',
+    '00de.adbe.ef0g',
+    '00dea.dbe.ef0a',
+    '00de:adbe:ef0a',
+    '00deadbeef0',
+    '00deadbeef0a0',
+    '00deadbeefxa',
+    '0:de:ad:be:ef:0a0',
+    ' 00deadbeef0a',
+    '00:de:ad:be:ef:0a\n',
+    'ab:cd:ef:gh:ij:kl',
+]
+
+
+@pytest.mark.parametrize('value', ACCEPTED)
+def test_normalize_mac_accepts(value):
+    assert normalize_mac(value) == CANONICAL
+
+
+@pytest.mark.parametrize('value', REJECTED)
+def test_normalize_mac_rejects(value):
+    assert normalize_mac(value) is None
+
+
+def test_normalize_many():
+    assert normalize_many(ACCEPTED[:2] + REJECTED[:2]) \
+        == [CANONICAL, CANONICAL, None, None]
+
+
+@pytest.mark.parametrize('value', ACCEPTED)
+def test_mac_field_normalizes(value):
+    form = Form(MultiDict({'mac': value, 'strict': CANONICAL}))
+    assert form.validate()
+    assert form.mac.data == CANONICAL
+
+
+@pytest.mark.parametrize('value', [value for value in REJECTED
+                                   if value is not None])
+def test_mac_field_rejects(value):
+    form = Form(MultiDict({'mac': value, 'strict': CANONICAL}))
+    assert not form.validate()
+    assert form.errors == {'mac': ['Invalid input.']}
+    assert form.mac.data == value
+
+
+@pytest.mark.parametrize('value', ACCEPTED[1:])
+def test_strict_mac_field_requires_canonical_notation(value):
+    form = Form(MultiDict({'mac': value, 'strict': value}))
+    assert not form.validate()
+    assert form.errors == {'strict': ['Invalid input.']}
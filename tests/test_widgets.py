@@ -0,0 +1,62 @@
+from functools import partial
+
+import pytest
+from wtforms.widgets import TextInput
+
+from wtforms_widgets import widgets
+from wtforms_widgets.base_form import BaseForm
+from wtforms_widgets.fields.core import RadioField
+from wtforms_widgets.widgets import BootstrapFieldListWidget, \
+    BootstrapFormControlDecorator, Disabler, decorate
+
+
+def render_input(field, **kwargs):
+    return kwargs
+
+
+def test_decorate_returns_same_chain_for_same_widget():
+    widget = TextInput()
+    decorated = decorate(widget, BootstrapFormControlDecorator)
+    assert decorate(widget, BootstrapFormControlDecorator) is decorated
+    assert decorated.widget is widget
+
+
+def test_decorate_keeps_equal_widgets_apart():
+    first, second = TextInput(), TextInput()
+    decorated = decorate(second, BootstrapFormControlDecorator)
+    assert decorate(first, BootstrapFormControlDecorator) is not decorated
+    assert decorated.widget is second
+
+
+def test_decorate_keeps_partial_widgets_apart():
+    first = partial(render_input, kind='first')
+    second = partial(render_input, kind='second')
+    assert decorate(first, Disabler).widget is first
+    assert decorate(second, Disabler).widget is second
+
+
+def test_decorate_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(widgets, '_interned_maxsize', 4)
+    for _ in range(10):
+        decorate(TextInput(), Disabler)
+    assert len(widgets._interned) <= 4
+
+
+class Form(BaseForm):
+    class Meta:
+        csrf = False
+
+    radio = RadioField('Radio', choices=[('x', 'X {}'), ('{y}', 'Y<')],
+                       default='{y}')
+
+
+@pytest.mark.parametrize('prefix', ['', 'a{b}', '{0}', '}{', '{{x}}'])
+@pytest.mark.parametrize('render_mode', ['basic', 'horizontal'])
+def test_radio_templates_with_braces(app_context, prefix, render_mode):
+    field = Form(prefix=prefix).radio
+    assert field.widget._templates(field, {'render_mode': render_mode})
+    html = str(field(render_mode=render_mode, class_='{c}'))
+    assert html == ''.join(BootstrapFieldListWidget().iter_render(
+        field, render_mode=render_mode, class_='{c}'))
+    if render_mode == 'horizontal':
+        assert 'id="form-group-{}"'.format(field.name) in html
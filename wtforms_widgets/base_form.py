@@ -1,20 +1,343 @@
 from collections import OrderedDict
 
+import wtforms.fields
 from flask_wtf import FlaskForm as Form
+from wtforms.form import FormMeta
+from wtforms.utils import unset_value
 
+from .widgets import iter_render_field
 
-class BaseForm(Form):
-    def __iter__(self):
-        field_order = getattr(self, '_order', [])
 
-        if field_order:
-            ordered_fields = OrderedDict()
+class BaseFormMeta(FormMeta):
+    """
+    Metaclass of :class:`BaseForm`.
 
-            for name in field_order:
-                ordered_fields[name] = self._fields.pop(name)
+    Applies the field order given by the ``_order`` attribute once per form
+    class to the ``_unbound_fields`` list, so the fields of an instance are
+    already bound in the final order. Fields not mentioned in ``_order`` follow
+    in their order of definition.
 
-            ordered_fields.update(self._fields)
+    For classes with ``_lazy_binding`` the fields are replaced by
+    :class:`LazyFieldAttribute` descriptors.
 
-            self._fields = ordered_fields
+    ``_dependents`` maps field names to the names of the fields with a
+    validator whose ``deciding_field`` (e.g.
+    :class:`~wtforms_widgets.fields.validators.OptionalIf`) is that field.
+    """
 
-        return super(BaseForm, self).__iter__()
+    def __init__(cls, name, bases, attrs):
+        super(BaseFormMeta, cls).__init__(name, bases, attrs)
+        cls._prepare_fields()
+
+    def __call__(cls, *args, **kwargs):
+        if cls._unbound_fields is None:
+            cls._prepare_fields()
+        return super(BaseFormMeta, cls).__call__(*args, **kwargs)
+
+    def _prepare_fields(cls):
+        cls._unbound_fields = cls._ordered_fields()
+        cls._dependents = _dependents(cls._unbound_fields)
+        if getattr(cls, '_lazy_binding', False):
+            for name, unbound_field in cls._unbound_fields:
+                # bypass FormMeta.__setattr__, the fields are unchanged
+                type.__setattr__(cls, name,
+                                 LazyFieldAttribute(name, unbound_field))
+
+    def __setattr__(cls, name, value):
+        if name == '_order':
+            cls._unbound_fields = None
+        super(BaseFormMeta, cls).__setattr__(name, value)
+
+    def _ordered_fields(cls):
+        fields = []
+        for name in dir(cls):
+            if not name.startswith('_'):
+                unbound_field = getattr(cls, name)
+                if hasattr(unbound_field, '_formfield'):
+                    fields.append((name, unbound_field))
+        fields.sort(key=lambda x: (x[1].creation_counter, x[0]))
+
+        order = getattr(cls, '_order', ())
+        names = {name for name, _ in fields}
+        unknown = [name for name in order if name not in names]
+        if unknown:
+            raise ValueError("Unknown fields in {}._order: {}".format(
+                cls.__name__, ', '.join(unknown)))
+        position = {name: i for i, name in enumerate(order)}
+        # sort is stable, unordered fields keep their definition order
+        fields.sort(key=lambda x: position.get(x[0], len(position)))
+        return fields
+
+
+def _unbound_validators(unbound_field):
+    if 'validators' in unbound_field.kwargs:
+        return unbound_field.kwargs['validators'] or ()
+    if len(unbound_field.args) > 1:
+        return unbound_field.args[1] or ()
+    return ()
+
+
+def _dependents(unbound_fields):
+    dependents = {}
+    for name, unbound_field in unbound_fields:
+        for validator in _unbound_validators(unbound_field):
+            deciding_field = getattr(validator, 'deciding_field', None)
+            if deciding_field is not None:
+                dependents.setdefault(deciding_field, []).append(name)
+    return dependents
+
+
+class LazyFieldAttribute(object):
+    """
+    Class attribute of a lazily bound field.
+
+    Returns the unbound field on the class and binds the field on first
+    access on an instance, which then stores it as instance attribute.
+    """
+
+    def __init__(self, name, unbound_field):
+        self.name = name
+        self.unbound_field = unbound_field
+
+    def __get__(self, form, form_class=None):
+        if form is None:
+            return self.unbound_field
+        return form._fields[self.name]
+
+
+class LazyFields(OrderedDict):
+    """
+    The fields of a form with ``_lazy_binding``, in order.
+
+    Fields are bound and processed with the arguments of the last
+    :meth:`BaseForm.process` call the first time they are looked up. Lookups
+    by key, :meth:`get`, :meth:`values` and :meth:`items` bind the fields,
+    iterating the names does not.
+
+    :param form: the form owning the fields
+    :param unbound_fields: ``(name, unbound field)`` pairs
+    :param bound: fields already bound by the form, e.g. the CSRF token
+    """
+
+    def __init__(self, form, unbound_fields, bound=()):
+        super(LazyFields, self).__init__()
+        self.form = form
+        self.translations = form.meta.get_translations(form)
+        self.process_args = None
+        self.unbound = OrderedDict(unbound_fields)
+        for name in self.unbound:
+            OrderedDict.__setitem__(self, name, None)
+        self.update(bound)
+
+    def __getitem__(self, name):
+        field = OrderedDict.__getitem__(self, name)
+        if field is None:
+            field = self._bind(name)
+        return field
+
+    def __delitem__(self, name):
+        OrderedDict.__delitem__(self, name)
+        self.unbound.pop(name, None)
+
+    def get(self, name, default=None):
+        return self[name] if name in self else default
+
+    def values(self):
+        return (self[name] for name in self)
+
+    def items(self):
+        return ((name, self[name]) for name in self)
+
+    def bound_items(self):
+        """Return the ``(name, field)`` pairs of the bound fields."""
+        return [(name, field) for name, field in OrderedDict.items(self)
+                if field is not None]
+
+    def _bind(self, name):
+        form = self.form
+        unbound_field = self.unbound.pop(name)
+        field = form.meta.bind_field(form, unbound_field, dict(
+            name=unbound_field.name or name,
+            prefix=form._prefix,
+            translations=self.translations,
+        ))
+        OrderedDict.__setitem__(self, name, field)
+        setattr(form, name, field)
+        if self.process_args is not None:
+            self.process_field(name, field)
+        return field
+
+    def process_field(self, name, field):
+        """Process ``field`` like :meth:`wtforms.form.Form.process` does."""
+        formdata, obj, kwargs, extra_filters = self.process_args
+        filters = list(extra_filters.get(name, ()))
+        inline_filter = getattr(self.form, 'filter_{}'.format(name), None)
+        if inline_filter is not None:
+            filters.append(inline_filter)
+
+        if obj is not None and hasattr(obj, name):
+            data = getattr(obj, name)
+        elif name in kwargs:
+            data = kwargs[name]
+        else:
+            data = unset_value
+        field.process(formdata, data, extra_filters=filters)
+
+
+def _walk_fields(fields):
+    for field in fields:
+        yield field
+        if isinstance(field, wtforms.fields.FormField):
+            yield from _walk_fields(field.form)
+        elif isinstance(field, wtforms.fields.FieldList):
+            yield from _walk_fields(field.entries)
+
+
+class BaseForm(Form, metaclass=BaseFormMeta):
+    """
+    Base class of all forms.
+
+    ``_order`` lists field names which are moved to the front in the given
+    order. Set ``_lazy_binding`` to bind and process fields only when they
+    are first accessed, see :class:`LazyFields`. Validation, ``data``,
+    ``errors`` and ``populate_obj`` still cover all fields.
+
+    ``_parallel_threshold`` is the number of entries from which a
+    :class:`~wtforms_widgets.fields.core.FieldList` is validated in the
+    executor passed to :meth:`validate`, in chunks of
+    ``_parallel_chunk_size`` entries.
+    """
+    _order = ()
+    _lazy_binding = False
+    _parallel_threshold = 1000
+    _parallel_chunk_size = 250
+    _executor = None
+
+    def __init__(self, *args, **kwargs):
+        if self._lazy_binding:
+            # only the CSRF field is bound by wtforms, the others are bound
+            # by LazyFields
+            self._unbound_fields = ()
+            super(BaseForm, self).__init__(*args, **kwargs)
+            del self._unbound_fields
+        else:
+            super(BaseForm, self).__init__(*args, **kwargs)
+
+    def process(self, formdata=None, obj=None, data=None, extra_filters=None,
+                **kwargs):
+        if not self._lazy_binding:
+            return super(BaseForm, self).process(
+                formdata, obj, data, extra_filters, **kwargs)
+        if not isinstance(self._fields, LazyFields):
+            self._fields = LazyFields(self, type(self)._unbound_fields,
+                                      self._fields)
+        formdata = self.meta.wrap_formdata(self, formdata)
+        if data is not None:
+            kwargs = dict(data, **kwargs)
+        self._fields.process_args = (formdata, obj, kwargs,
+                                     extra_filters or {})
+        for name, field in self._fields.bound_items():
+            self._fields.process_field(name, field)
+
+    def validate(self, extra_validators=None, executor=None):
+        """
+        Validate the form.
+
+        :param extra_validators: dict mapping field names to lists of extra
+            validators
+        :param concurrent.futures.Executor executor: executor validating the
+            entries of large field lists, usually a
+            :class:`~concurrent.futures.ProcessPoolExecutor`, see
+            :mod:`wtforms_widgets.parallel`. The result is the same as
+            without.
+        """
+        # errors aggregated by WTForms < 3 are recomputed
+        self._errors = None
+        self._executor = executor
+        try:
+            return super(BaseForm, self).validate(extra_validators)
+        finally:
+            del self._executor
+
+    def iter_render(self, **kwargs):
+        """
+        Render all fields of the form as a stream of markup chunks.
+
+        The keyword arguments (e.g. ``render_mode``) are passed to every
+        field. Nested :class:`FieldList` and :class:`FormField` fields are
+        streamed instead of being joined into one string first, so the
+        generator can be passed to :func:`flask.stream_with_context`.
+        """
+        for field in self:
+            yield from iter_render_field(field, **kwargs)
+
+    def validate_fields(self, names, extra_validators=None, dependents=True):
+        """
+        Validate only the named fields, e.g. for live validation while the
+        user is typing.
+
+        Fields read by cross-field validators such as
+        :class:`~wtforms_widgets.fields.validators.OptionalIf` are bound on
+        demand, with ``_lazy_binding`` no other field is bound.
+
+        :param names: names of the fields to validate
+        :param extra_validators: dict mapping field names to lists of extra
+            validators, as for :meth:`validate`
+        :param bool dependents: also validate the fields whose validators
+            depend on one of the named fields
+        :returns: the names of the validated fields
+        :raises ValueError: if a name is no field of the form
+        """
+        names = list(names)
+        unknown = [name for name in names if name not in self._fields]
+        if unknown:
+            raise ValueError("Unknown fields: {}".format(', '.join(unknown)))
+        if dependents:
+            seen = set(names)
+            # names appended in the loop are visited as well
+            for name in names:
+                for dependent in self._dependents.get(name, ()):
+                    if dependent not in seen:
+                        seen.add(dependent)
+                        names.append(dependent)
+
+        self._errors = None
+        for name in names:
+            extra = list(extra_validators.get(name, ())) \
+                if extra_validators is not None else []
+            inline = getattr(self.__class__, 'validate_{}'.format(name), None)
+            if inline is not None:
+                extra.append(inline)
+            self._fields[name].validate(self, extra)
+        return names
+
+    def validation_result(self, names, **kwargs):
+        """
+        Validate the named fields with :meth:`validate_fields` and return
+        the result as compact, json serializable dict::
+
+            {"valid": false, "fields": ["a", "b"], "errors": {"b": ["..."]}}
+
+        ``fields`` lists the validated fields, ``errors`` contains the
+        invalid ones only.
+        """
+        names = self.validate_fields(names, **kwargs)
+        # validators may have aggregated the errors while validating
+        self._errors = None
+        errors = {name: self._fields[name].errors for name in names
+                  if self._fields[name].errors}
+        return {"valid": not errors, "fields": names, "errors": errors}
+
+    async def load_choices(self):
+        """
+        Load the choices of all query-backed fields of the form, including
+        nested forms, concurrently.
+
+        Fields sharing a query load it once. Afterwards rendering and
+        validation don't hit the database for these fields.
+        """
+        import asyncio
+        await asyncio.gather(*(
+            field.load_choices() for field in _walk_fields(self)
+            if hasattr(field, 'load_choices')
+        ))
@@ -0,0 +1,139 @@
+"""
+Column-wise validation of homogeneous forms, e.g. the entries of a
+:class:`wtforms_widgets.fields.core.FieldList` of
+:class:`~wtforms_widgets.fields.core.FormField`.
+
+Instead of validating row by row, the fields of all rows sharing a name are
+validated together, validator by validator. Validators providing a
+``validate_batch(forms, fields)`` method are called once per column and
+return a list with ``None``, a :class:`~wtforms.validators.ValidationError`
+or a :class:`~wtforms.validators.StopValidation` per row. All other
+validators are called row by row.
+
+The errors are the same as with row by row validation as long as validators
+don't depend on the validation errors of other fields of the row.
+"""
+from itertools import chain
+
+import wtforms.fields
+import wtforms.form
+from wtforms.fields.core import Field
+from wtforms.validators import StopValidation, ValidationError
+
+
+def _is_plain_field(field):
+    return type(field).validate is Field.validate
+
+
+def is_bulk_validatable(entries):
+    """
+    Tell whether the given :class:`~wtforms.fields.FormField` entries can be
+    validated column-wise.
+    """
+    if not entries:
+        return False
+    first = entries[0]
+    if not isinstance(first, wtforms.fields.FormField):
+        return False
+    from .base_form import BaseForm
+    field_type = type(first)
+    form_type = type(first.form)
+    return (field_type.validate is wtforms.fields.FormField.validate
+            and form_type.validate in (wtforms.form.Form.validate,
+                                       BaseForm.validate)
+            and all(type(entry) is field_type and type(entry.form) is form_type
+                    for entry in entries))
+
+
+def run_validator(validator, forms, fields):
+    """
+    Run a validator on a column of fields.
+
+    :returns: a list containing ``None`` or the raised exception per row
+    """
+    validate_batch = getattr(validator, 'validate_batch', None)
+    if validate_batch is not None:
+        return validate_batch(forms, fields)
+
+    results = []
+    for form, field in zip(forms, fields):
+        try:
+            validator(form, field)
+        except (StopValidation, ValidationError) as e:
+            results.append(e)
+        else:
+            results.append(None)
+    return results
+
+
+def validate_column(forms, fields, extra_validators=()):
+    """
+    Validate fields of the same definition of several forms like
+    :meth:`wtforms.fields.Field.validate` would.
+    """
+    first = fields[0]
+    first.check_validators(extra_validators)
+    for field in fields:
+        field.errors = list(field.process_errors)
+    stopped = [False] * len(fields)
+
+    if type(first).pre_validate is not Field.pre_validate:
+        for i, (form, field) in enumerate(zip(forms, fields)):
+            try:
+                field.pre_validate(form)
+            except StopValidation as e:
+                if e.args and e.args[0]:
+                    field.errors.append(e.args[0])
+                stopped[i] = True
+            except ValidationError as e:
+                field.errors.append(e.args[0])
+
+    for validator in chain(first.validators, extra_validators):
+        active = [i for i, stop in enumerate(stopped) if not stop]
+        if not active:
+            break
+        results = run_validator(validator,
+                                [forms[i] for i in active],
+                                [fields[i] for i in active])
+        for i, result in zip(active, results):
+            if result is None:
+                continue
+            if isinstance(result, StopValidation):
+                if result.args and result.args[0]:
+                    fields[i].errors.append(result.args[0])
+                stopped[i] = True
+            else:
+                fields[i].errors.append(result.args[0])
+
+    if type(first).post_validate is not Field.post_validate:
+        for form, field, stop in zip(forms, fields, stopped):
+            try:
+                field.post_validate(form, stop)
+            except ValidationError as e:
+                field.errors.append(e.args[0])
+
+
+def validate_forms(forms):
+    """
+    Validate forms of the same class column by column.
+
+    :param list[wtforms.Form] forms: forms of the same class
+    :returns: whether all forms are valid
+    """
+    if not forms:
+        return True
+    form_type = type(forms[0])
+    for name in forms[0]._fields:
+        fields = [form._fields[name] for form in forms]
+        inline = getattr(form_type, 'validate_{}'.format(name), None)
+        extra = (inline,) if inline is not None else ()
+        first = fields[0]
+        if (_is_plain_field(first)
+                and all(type(field) is type(first)
+                        and field.validators is first.validators
+                        for field in fields)):
+            validate_column(forms, fields, extra)
+        else:
+            for form, field in zip(forms, fields):
+                field.validate(form, extra)
+    return not any(form.errors for form in forms)
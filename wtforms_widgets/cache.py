@@ -0,0 +1,359 @@
+import datetime
+import decimal
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import partial
+from threading import Lock
+from types import BuiltinFunctionType, FunctionType
+
+import wtforms.widgets
+from markupsafe import Markup
+from wtforms.widgets.core import html_params
+
+from .renderers import get_renderer
+from .widgets import WidgetDecorator, widget_state
+
+
+class RenderCacheBackend(ABC):
+    """
+    Storage of a :class:`RenderCache`.
+
+    The interface is the one of ``cachelib``/``Flask-Caching`` caches, so such
+    a cache can be passed as backend directly to share rendered markup between
+    worker processes.
+    """
+
+    @abstractmethod
+    def get(self, key):
+        """
+        :param str key: cache key
+        :returns: the stored markup or ``None`` if the key is unknown
+        """
+
+    @abstractmethod
+    def set(self, key, value):
+        """
+        :param str key: cache key
+        :param str value: rendered markup
+        """
+
+    @abstractmethod
+    def clear(self):
+        """Remove all entries."""
+
+
+class LRURenderCacheBackend(RenderCacheBackend):
+    """Size-bounded per process backend discarding least recently used
+    entries."""
+
+    def __init__(self, maxsize=1024):
+        if maxsize < 1:
+            raise ValueError('Parameter maxsize must be positive.')
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return None
+            return self._entries[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _qualname(obj):
+    return '{0}.{1}'.format(obj.__module__, obj.__qualname__)
+
+
+def stable_state(value):
+    """
+    Convert ``value`` to nested lists of JSON values, which are equal in all
+    processes for equal values.
+
+    Supported are ``None``, numbers, strings, dates, times, decimals, lists,
+    tuples, sets and dicts of these, classes, functions and
+    :func:`functools.partial` objects of them.
+
+    :raises TypeError: if ``value`` has no stable representation, e.g. an
+        arbitrary object whose ``repr`` contains its id
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [stable_state(item) for item in value]
+    if isinstance(value, dict):
+        return ['dict', sorted(([stable_state(k), stable_state(v)]
+                                for k, v in value.items()),
+                               key=lambda item: json.dumps(item[0]))]
+    if isinstance(value, (set, frozenset)):
+        return ['set', sorted(json.dumps(stable_state(item), sort_keys=True)
+                              for item in value)]
+    if isinstance(value, (datetime.date, datetime.time)):
+        return [_qualname(type(value)), value.isoformat()]
+    if isinstance(value, (datetime.timedelta, decimal.Decimal)):
+        return [_qualname(type(value)), str(value)]
+    if isinstance(value, (type, FunctionType, BuiltinFunctionType)):
+        return ['callable', _qualname(value)]
+    if isinstance(value, partial):
+        return ['partial', stable_state(value.func), stable_state(value.args),
+                stable_state(value.keywords)]
+    raise TypeError('{0!r} has no stable representation'.format(value))
+
+
+def widget_identity(widget):
+    """
+    Describe a widget chain by the classes and attributes of all of its
+    layers, equally in all processes.
+
+    :raises TypeError: if an attribute has no stable representation, see
+        :func:`stable_state`
+    """
+    layers = []
+    while isinstance(widget, WidgetDecorator):
+        layers.append([_qualname(type(widget)), stable_state(
+            [item for item in widget_state(widget) if item[0] != 'widget'])])
+        widget = widget.widget
+    if isinstance(widget, (FunctionType, partial)):
+        layers.append(stable_state(widget))
+    else:
+        layers.append([_qualname(type(widget)),
+                       stable_state(widget_state(widget))])
+    return json.dumps(layers, separators=(',', ':'))
+
+
+class RenderCache(object):
+    """
+    Cache for the markup of fields whose rendering only depends on their
+    state, e.g. fields wrapped with
+    :func:`wtforms_widgets.fields.custom.static`.
+
+    Entries are keyed on the widget chain, the field's name, value and data
+    or rendered choices, label, description, flags and errors as well as the
+    render keyword arguments, the default render mode of the form and the
+    renderer. The key is a hash of a stable serialization of this state, see
+    :func:`stable_state`, so it can be shared between processes. Fields
+    whose state has no stable representation are rendered without cache.
+    """
+
+    def __init__(self, backend=None):
+        """
+        :param RenderCacheBackend backend: storage, defaults to a
+            :class:`LRURenderCacheBackend`
+        """
+        self.backend = backend if backend is not None else LRURenderCacheBackend()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(identity, field, kwargs):
+        """
+        :raises TypeError: if the state of the field has no stable
+            representation
+        """
+        if hasattr(field, 'iter_choices'):
+            # the selected choices tell the value
+            value = list(field.iter_choices())
+        elif hasattr(field, '_value'):
+            # _value() is constant for some fields, e.g. BooleanField
+            value = [field._value(), field.data]
+        else:
+            value = field.data
+        renderer = get_renderer(field)
+        state = stable_state([
+            identity,
+            _qualname(type(field)),
+            field.name, field.id, value,
+            str(field.label.text), str(field.description),
+            vars(field.flags),
+            [str(error) for error in field.errors],
+            kwargs,
+            getattr(field.meta, 'render_mode', None),
+            _qualname(type(renderer)), getattr(renderer, 'template', None),
+        ])
+        serialized = json.dumps(state, separators=(',', ':'))
+        digest = hashlib.sha1(serialized.encode('utf-8')).hexdigest()
+        return 'wtforms-widgets:render:' + digest
+
+    def render(self, identity, widget, field, kwargs):
+        try:
+            if identity is None:
+                raise TypeError(identity)
+            key = self.key(identity, field, kwargs)
+        except TypeError:
+            return Markup(widget(field, **kwargs))
+        html = self.backend.get(key)
+        if html is not None:
+            self.hits += 1
+            return Markup(html)
+        self.misses += 1
+        html = Markup(widget(field, **kwargs))
+        self.backend.set(key, str(html))
+        return html
+
+    def clear(self):
+        self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+#: Cache used by :class:`CachedRenderDecorator` if none is given.
+render_cache = RenderCache()
+
+
+class CachedRenderDecorator(WidgetDecorator):
+    """Serves the markup of the decorated widget from a :class:`RenderCache`."""
+    __slots__ = ('cache', 'identity')
+
+    def __init__(self, widget, cache=None):
+        """
+        :param widget: Original widget to be decorated.
+        :param RenderCache cache: cache to use, defaults to
+            :data:`render_cache`
+        """
+        super(CachedRenderDecorator, self).__init__(widget)
+        self.cache = cache
+        try:
+            self.identity = widget_identity(widget)
+        except TypeError:
+            # rendered without cache
+            self.identity = None
+
+    def __call__(self, field, **kwargs):
+        cache = self.cache if self.cache is not None else render_cache
+        return cache.render(self.identity, self.widget, field, kwargs)
+
+
+class OptionBlock(object):
+    """
+    Precomputed ``<option>`` markup of a choice list.
+
+    The markup of all options is joined once in its unselected form. Rendering
+    only splices the selected variants of the selected options into it.
+    """
+
+    def __init__(self, options):
+        """
+        :param options: tuples of ``(key, html, selected_html)``, where
+            ``key`` is the hashable key an option is selected by
+        """
+        offsets = []
+        selected_html = []
+        index = {}
+        html = []
+        position = 0
+        for i, (key, option_html, option_selected_html) in enumerate(options):
+            index.setdefault(key, []).append(i)
+            offsets.append((position, position + len(option_html)))
+            selected_html.append(option_selected_html)
+            html.append(option_html)
+            position += len(option_html)
+        self.html = u''.join(html)
+        self.offsets = offsets
+        self.selected_html = selected_html
+        self.index = index
+
+    @classmethod
+    def from_choices(cls, widget, choices, key):
+        """
+        :param wtforms.widgets.Select widget: widget rendering the options
+        :param choices: ``(value, label, selected, render_kw)`` tuples as
+            yielded by ``iter_choices()``
+        :param key: callable mapping a choice value to its option key
+        """
+        options = []
+        for value, label, _, *render_kw in choices:
+            render_kw = render_kw[0] if render_kw else {}
+            options.append((
+                key(value),
+                widget.render_option(value, label, False, **render_kw),
+                widget.render_option(value, label, True, **render_kw),
+            ))
+        return cls(options)
+
+    def render(self, selected_keys):
+        """
+        :param selected_keys: hashable keys of the selected options
+        """
+        indices = sorted({i for key in selected_keys
+                          for i in self.index.get(key, ())})
+        if not indices:
+            return self.html
+        html = []
+        position = 0
+        for i in indices:
+            start, end = self.offsets[i]
+            html.append(self.html[position:start])
+            html.append(self.selected_html[i])
+            position = end
+        html.append(self.html[position:])
+        return u''.join(html)
+
+
+#: Option blocks shared by all fields using :class:`SharedOptionsSelect`.
+option_blocks = LRURenderCacheBackend(maxsize=128)
+
+
+class SharedOptionsSelect(wtforms.widgets.Select):
+    """
+    Select widget rendering the options of fields with an ``options_key`` from
+    a shared :class:`OptionBlock`.
+
+    The field must provide ``option_key(value)`` mapping a choice value to a
+    hashable key, ``selected_option_keys()`` returning the keys of the
+    selected choices and ``choices_fingerprint()`` returning a hash of the
+    choices, so that fields with the same ``options_key`` but different
+    choices get different blocks. Fields without ``options_key`` or
+    ``choices_fingerprint`` and fields with option groups are rendered as by
+    :class:`wtforms.widgets.Select`.
+    """
+
+    def __call__(self, field, **kwargs):
+        options_key = getattr(field, 'options_key', None)
+        if callable(options_key):
+            options_key = options_key()
+        if (options_key is None or field.has_groups()
+                or not hasattr(field, 'choices_fingerprint')):
+            return super(SharedOptionsSelect, self).__call__(field, **kwargs)
+        try:
+            selected_keys = frozenset(field.selected_option_keys())
+            fingerprint = field.choices_fingerprint()
+        except TypeError:
+            # unhashable data or choices
+            return super(SharedOptionsSelect, self).__call__(field, **kwargs)
+
+        cache_key = (type(field), self.multiple, options_key, fingerprint)
+        block = option_blocks.get(cache_key)
+        if block is None:
+            block = OptionBlock.from_choices(self, field.iter_choices(),
+                                             field.option_key)
+            option_blocks.set(cache_key, block)
+
+        kwargs.setdefault("id", field.id)
+        if self.multiple:
+            kwargs["multiple"] = True
+        flags = getattr(field, "flags", {})
+        for k in dir(flags):
+            if k in self.validation_attrs and k not in kwargs:
+                kwargs[k] = getattr(flags, k)
+        return Markup(u''.join([
+            u"<select {}>".format(html_params(name=field.name, **kwargs)),
+            block.render(selected_keys),
+            u"</select>",
+        ]))
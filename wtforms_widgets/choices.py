@@ -0,0 +1,152 @@
+"""
+Shared, immutable choice lists.
+
+A :class:`ChoiceSet` can be passed as ``choices`` to
+:class:`~wtforms_widgets.fields.core.SelectField`,
+:class:`~wtforms_widgets.fields.core.SelectMultipleField` and
+:class:`~wtforms_widgets.fields.core.RadioField`. The fields keep a reference
+instead of copying the choices on every bind, check submitted values with a
+hash index and render their options from a shared block.
+
+Named choice sets are kept in a :class:`ChoiceRegistry`. Registering new
+choices under an existing name creates a new version, fields bound
+afterwards use it:
+
+    >>> buildings = choice_sets.register('buildings', [('1', 'Wu 1')])
+    >>> field = SelectField('Building', choices=choice_sets.ref('buildings'))
+"""
+from functools import partial
+from threading import Lock
+
+from markupsafe import escape
+
+
+def _normalize(choice):
+    if isinstance(choice, tuple):
+        return choice
+    if isinstance(choice, list):
+        return tuple(choice)
+    return choice, choice
+
+
+def _hashable(choice):
+    if len(choice) > 2 and choice[2]:
+        return choice[0], choice[1], tuple(sorted(choice[2].items()))
+    return choice[0], choice[1]
+
+
+def choices_hash(choices):
+    """
+    Return a hash of the values, labels and ``render_kw`` of ``choices``,
+    used to tell choice lists apart, e.g. by
+    :class:`~wtforms_widgets.cache.SharedOptionsSelect`.
+
+    :raises TypeError: if a value, label or ``render_kw`` value is
+        unhashable
+    """
+    return hash(tuple(_hashable(_normalize(choice)) for choice in choices))
+
+
+class ChoiceSet(tuple):
+    """
+    Immutable sequence of ``(value, label)`` or ``(value, label, render_kw)``
+    tuples. Plain values are expanded to ``(value, value)``.
+
+    :param choices: iterable of choices
+    :param str name: name the set is registered under, if any
+    :param int version: version of the named set
+    """
+
+    def __new__(cls, choices, name=None, version=0):
+        return super(ChoiceSet, cls).__new__(cls, map(_normalize, choices))
+
+    def __init__(self, choices, name=None, version=0):
+        self.name = name
+        self.version = version
+        self._indexes = {}
+        self._escaped = None
+        self._hash = None
+
+    @property
+    def key(self):
+        """Hashable identity of the set, ``None`` for anonymous sets."""
+        if self.name is None:
+            return None
+        return self.name, self.version
+
+    def values(self, coerce=str):
+        """
+        Return the coerced values of all choices as frozenset. The set is
+        built once per ``coerce`` function.
+        """
+        try:
+            return self._indexes[coerce]
+        except KeyError:
+            pass
+        values = self._indexes[coerce] = frozenset(
+            coerce(choice[0]) for choice in self)
+        return values
+
+    def escaped(self):
+        """
+        Return the HTML escaped ``(value, label)`` pairs of all choices, as
+        used by the checkbox and radio list widgets. Computed once.
+        """
+        if self._escaped is None:
+            self._escaped = tuple(
+                (str(escape(choice[0])), str(escape(choice[1])))
+                for choice in self)
+        return self._escaped
+
+    def fingerprint(self):
+        """Return :func:`choices_hash` of the choices, computed once."""
+        if self._hash is None:
+            self._hash = choices_hash(self)
+        return self._hash
+
+    def __repr__(self):
+        return '<{0} {1!r} version {2}, {3} choices>'.format(
+            type(self).__name__, self.name, self.version, len(self))
+
+
+class ChoiceRegistry(object):
+    """Process wide store of the current version of named choice sets."""
+
+    def __init__(self):
+        self._sets = {}
+        self._lock = Lock()
+
+    def register(self, name, choices):
+        """
+        Store ``choices`` under ``name`` and return the :class:`ChoiceSet`.
+
+        The version is incremented if the choices differ from the current
+        ones, otherwise the current set is returned.
+        """
+        with self._lock:
+            current = self._sets.get(name)
+            choice_set = ChoiceSet(choices, name,
+                                   0 if current is None else current.version)
+            if current is not None:
+                if tuple.__eq__(current, choice_set):
+                    return current
+                choice_set.version += 1
+            self._sets[name] = choice_set
+            return choice_set
+
+    def __getitem__(self, name):
+        return self._sets[name]
+
+    def __contains__(self, name):
+        return name in self._sets
+
+    def ref(self, name):
+        """
+        Return a callable resolving to the current version of ``name``, to
+        be passed as ``choices``. It is called whenever a form is bound.
+        """
+        return partial(self.__getitem__, name)
+
+
+#: Default registry.
+choice_sets = ChoiceRegistry()
@@ -1,38 +1,142 @@
 import re
 import typing as t
 from datetime import datetime
+from functools import lru_cache
 from itertools import chain
+from types import MappingProxyType
 
 import wtforms
+from wtforms.validators import ValidationError
 
 from ..widgets import decorate_field, BootstrapFormControlDecorator, \
     BootstrapStandardDecorator, \
     BootstrapRadioDecorator, BootstrapCheckboxDecorator, \
     BootstrapFieldListWidget, BootstrapFormFieldWidget, \
     BootstrapDatepickerWidget, MoneyFieldDecorator, decorate, \
-    BootstrapFormSelectDecorator
-
-
-class SelectField(wtforms.fields.SelectField):
-    widget = decorate_field(
-        wtforms.fields.SelectField,
+    BootstrapFormSelectDecorator, BootstrapRadioListWidget
+from ..bulk import is_bulk_validatable, validate_forms
+from ..parallel import validate_entries
+from ..cache import SharedOptionsSelect
+from ..choices import ChoiceSet, choices_hash
+
+
+class SharedOptionsMixin(object):
+    """
+    Render the options of a select field from a precomputed block shared
+    between all fields with the same ``options_key``.
+
+    :param options_key: hashable key identifying the choice list and its
+        version, or a callable returning it. Change the key whenever the
+        choices change. Without a key, options are rendered one by one.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.options_key = kwargs.pop('options_key', None)
+        super(SharedOptionsMixin, self).__init__(*args, **kwargs)
+
+    @property
+    def options_key(self):
+        # fields with a named ChoiceSet share the block of its version
+        if self._options_key is None:
+            choices = getattr(self, 'choices', None)
+            if isinstance(choices, ChoiceSet) and choices.key is not None:
+                return choices.key + (self.coerce,)
+        return self._options_key
+
+    @options_key.setter
+    def options_key(self, value):
+        self._options_key = value
+
+    def option_key(self, value):
+        return self.coerce(value)
+
+    def selected_option_keys(self):
+        return (self.data,)
+
+    def choices_fingerprint(self):
+        """
+        Return a hash of the choices, which is part of the key of the shared
+        block, so that fields with the same ``options_key`` but different
+        choices don't share it.
+        """
+        if isinstance(self.choices, ChoiceSet):
+            return self.choices.fingerprint()
+        return choices_hash(self.choices)
+
+
+class ChoiceSetMixin(object):
+    """
+    Keep a :class:`~wtforms_widgets.choices.ChoiceSet` passed as ``choices``
+    (or returned by a ``choices`` callable) instead of copying it, and check
+    the submitted values with its hash index.
+    """
+
+    def __init__(self, *args, **kwargs):
+        choices = kwargs.get('choices')
+        if callable(choices):
+            choices = kwargs['choices'] = choices()
+        if not isinstance(choices, ChoiceSet):
+            super(ChoiceSetMixin, self).__init__(*args, **kwargs)
+            return
+        kwargs['choices'] = None
+        super(ChoiceSetMixin, self).__init__(*args, **kwargs)
+        self.choices = choices
+
+    def pre_validate(self, form):
+        if not (self.validate_choice and isinstance(self.choices, ChoiceSet)):
+            return super(ChoiceSetMixin, self).pre_validate(form)
+        try:
+            valid = self.data in self.choices.values(self.coerce)
+        except TypeError:
+            # unhashable data
+            return super(ChoiceSetMixin, self).pre_validate(form)
+        if not valid:
+            raise ValidationError(self.gettext("Not a valid choice."))
+
+
+class SelectField(SharedOptionsMixin, ChoiceSetMixin,
+                  wtforms.fields.SelectField):
+    widget = decorate(
+        SharedOptionsSelect(),
         BootstrapFormControlDecorator,
         BootstrapFormSelectDecorator,
         BootstrapStandardDecorator,
     )
 
 
-class SelectMultipleField(wtforms.fields.SelectMultipleField):
-    widget = decorate_field(
-        wtforms.fields.SelectMultipleField,
+class SelectMultipleField(SharedOptionsMixin, ChoiceSetMixin,
+                          wtforms.fields.SelectMultipleField):
+    widget = decorate(
+        SharedOptionsSelect(multiple=True),
         BootstrapFormControlDecorator,
         BootstrapFormSelectDecorator,
         BootstrapStandardDecorator,
     )
 
-
-class RadioField(wtforms.fields.RadioField):
-    widget = BootstrapFieldListWidget()
+    def selected_option_keys(self):
+        return self.data or ()
+
+    def pre_validate(self, form):
+        if not (self.validate_choice and self.data
+                and isinstance(self.choices, ChoiceSet)):
+            return wtforms.fields.SelectMultipleField.pre_validate(self, form)
+        try:
+            acceptable = self.choices.values(self.coerce)
+            unacceptable = [str(data) for data in set(self.data)
+                            if data not in acceptable]
+        except TypeError:
+            # unhashable data
+            return wtforms.fields.SelectMultipleField.pre_validate(self, form)
+        if unacceptable:
+            raise ValidationError(self.ngettext(
+                "'%(value)s' is not a valid choice for this field.",
+                "'%(value)s' are not valid choices for this field.",
+                len(unacceptable),
+            ) % dict(value="', '".join(unacceptable)))
+
+
+class RadioField(ChoiceSetMixin, wtforms.fields.RadioField):
+    widget = BootstrapRadioListWidget()
     option_widget = decorate(
         wtforms.widgets.RadioInput(),
         BootstrapRadioDecorator,
@@ -142,20 +246,33 @@ class DateField(wtforms.fields.DateField):
     def __init__(self, label=None, validators=None, format='%Y-%m-%d',
                  **kwargs):
         # Move Bootstrap datepicker specific options to its own dict
-        self.datepicker_options = dict((
-            (option, value) for (option, value) in kwargs.items()
+        options = tuple(sorted(
+            (option, kwargs.pop(option)) for option in tuple(kwargs)
             if option in self.available_datepicker_options
         ))
-        for option in self.datepicker_options.keys():
-            kwargs.pop(option)
-        defaults = {'default': datetime.utcnow(), 'language': 'de',
+        try:
+            self.datepicker_options = self._datepicker_options(format, options)
+        except TypeError:
+            # unhashable option values can't be cached
+            self.datepicker_options = self._datepicker_options.__wrapped__(
+                type(self), format, options)
+        super(DateField, self).__init__(label, validators, format, **kwargs)
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _datepicker_options(cls, format, options):
+        """
+        Build the read-only datepicker options of a field definition.
+
+        Callable values are evaluated when the field is rendered.
+        """
+        defaults = {'default': datetime.utcnow, 'language': 'de',
                     'today_highlight': 'true', 'today_btn': 'linked'}
-        self.datepicker_options = dict(chain(defaults.items(),
-                                             self.datepicker_options.items()))
+        datepicker_options = dict(chain(defaults.items(), options))
         # The format option is used by both DateField and Bootstrap datepicker,
         # albeit with a different format string syntax.
-        self.datepicker_options['format'] = self.convert_format_string(format)
-        super(DateField, self).__init__(label, validators, format, **kwargs)
+        datepicker_options['format'] = cls.convert_format_string(format)
+        return MappingProxyType(datepicker_options)
 
     @classmethod
     def _replacement_function(cls, match):
@@ -177,6 +294,7 @@ class DateField(wtforms.fields.DateField):
         return percentage_signs[0:percentage_sign_count // 2] + replacement
 
     @classmethod
+    @lru_cache(maxsize=256)
     def convert_format_string(cls, format):
         """
         Convert a datetime strftime/strptime to a Bootstrap datepicker format
@@ -218,43 +336,78 @@ class SubmitField(wtforms.fields.SubmitField):
     )
 
 
-try:
-    import wtforms_sqlalchemy.fields
-except ImportError:
-    def __getattr__(name: str) -> t.Any:
-        if name in ("QuerySelectField", "QuerySelectmultipleField"):
+_query_fields = ("QuerySelectField", "QuerySelectMultipleField")
+
+
+def __getattr__(name: str) -> t.Any:
+    # the query fields pull in SQLAlchemy, import them on first use only
+    if name in _query_fields:
+        try:
+            from . import query
+        except ImportError as e:
+            if not (e.name or '').startswith(('wtforms_sqlalchemy',
+                                              'sqlalchemy')):
+                raise
             raise AttributeError(
-                f"To use the {name!r}, install `wtforms_sqalalchemy`"
+                f"To use the {name!r}, install `wtforms_sqlalchemy`"
                 " via the `[sql]` optional dependency group"
                 " (`pip install wtforms-widgets[sql]`)"
-            )
-        raise AttributeError(f"module {__name__!r} has on attribute {name!r}!")
-else:
-    class QuerySelectField(
-        wtforms_sqlalchemy.fields.QuerySelectField
-    ):
-        widget = decorate_field(
-            wtforms_sqlalchemy.fields.QuerySelectField,
-            BootstrapFormControlDecorator,
-            BootstrapFormSelectDecorator,
-            BootstrapStandardDecorator,
-        )
-
-
-    class QuerySelectMultipleField(
-        wtforms_sqlalchemy.fields.QuerySelectMultipleField
-    ):
-        widget = decorate_field(
-            wtforms_sqlalchemy.fields.QuerySelectMultipleField,
-            BootstrapFormControlDecorator,
-            BootstrapFormSelectDecorator,
-            BootstrapStandardDecorator,
-        )
+            ) from e
+        value = globals()[name] = getattr(query, name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class FieldList(wtforms.fields.FieldList):
+    """
+    A :class:`wtforms.fields.FieldList` with an optional bulk validation mode.
+
+    Entries of lists with at least ``_parallel_threshold`` entries are
+    validated in the executor passed to :meth:`BaseForm.validate
+    <wtforms_widgets.base_form.BaseForm.validate>`, see
+    :mod:`wtforms_widgets.parallel`.
+
+    :param bulk_validation: Validate entries of a homogeneous
+        ``FieldList(FormField(...))`` column by column, see
+        :mod:`wtforms_widgets.bulk`. Other entries are validated as usual.
+    """
     widget = BootstrapFieldListWidget()
 
+    def __init__(self, *args, **kwargs):
+        self.bulk_validation = kwargs.pop('bulk_validation', False)
+        super(FieldList, self).__init__(*args, **kwargs)
+
+    def validate(self, form, extra_validators=()):
+        if not self._validate_entries(form):
+            return super(FieldList, self).validate(form, extra_validators)
+
+        self.errors = [entry.errors for entry in self.entries]
+        if not any(x for x in self.errors):
+            self.errors = []
+
+        self._run_validation_chain(
+            form, chain(self.validators, extra_validators))
+
+        return len(self.errors) == 0
+
+    def _validate_entries(self, form):
+        """
+        Validate the entries in the form's executor or column by column.
+
+        :returns: whether the entries were validated
+        """
+        executor = getattr(form, '_executor', None)
+        if (executor is not None
+                and len(self.entries) >= form._parallel_threshold
+                and validate_entries(executor, self.entries,
+                                     form._parallel_chunk_size,
+                                     self.bulk_validation)):
+            return True
+        if self.bulk_validation and is_bulk_validatable(self.entries):
+            validate_forms([entry.form for entry in self.entries])
+            return True
+        return False
+
 
 class FormField(wtforms.fields.FormField):
     widget = BootstrapFormFieldWidget()
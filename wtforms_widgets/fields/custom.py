@@ -1,7 +1,13 @@
+import re
+from collections import namedtuple
+from datetime import timedelta
+from functools import lru_cache
+
 from wtforms import fields
 from wtforms.validators import ValidationError
 
 from . import core
+from ..cache import CachedRenderDecorator
 from ..widgets import LazyLoadSelectWidget, \
     BootstrapFormControlDecorator, BootstrapStandardDecorator, \
     decorate, BootstrapStaticFieldWidget, \
@@ -9,18 +15,155 @@ from ..widgets import LazyLoadSelectWidget, \
     BootstrapFormSelectDecorator
 
 
-def static(field):
-    widget = field.kwargs.get("widget", field.field_class.widget)
-    field.kwargs["widget"] = decorate(
+@lru_cache(maxsize=512)
+def _static_widget(widget):
+    return decorate(
         BootstrapStaticFieldWidget(),
         *reversed(list(decorators(widget)))
     )
+
+
+@lru_cache(maxsize=512)
+def _disabled_widget(widget):
+    return decorate(widget, Disabler)
+
+
+def _transformed_widget(transform, field):
+    widget = field.kwargs.get("widget", field.field_class.widget)
+    try:
+        return transform(widget)
+    except TypeError:
+        # unhashable widgets can't be cached
+        return transform.__wrapped__(widget)
+
+
+def static(field):
+    """
+    Render a field as static control, keeping the decorators of its widget.
+    The static widget is built once per widget chain.
+    """
+    field.kwargs["widget"] = _transformed_widget(_static_widget, field)
     return field
 
 
 def disabled(field):
+    """
+    Render a field disabled. The disabled widget is built once per widget
+    chain.
+    """
+    field.kwargs["widget"] = _transformed_widget(_disabled_widget, field)
+    return field
+
+
+def _copy_unbound(field, **kwargs):
+    """
+    Copy an unbound field with replaced ``kwargs``, keeping its position in
+    the form.
+    """
+    copy = fields.core.UnboundField(field.field_class, *field.args,
+                                    name=field.name,
+                                    **dict(field.kwargs, **kwargs))
+    copy.creation_counter = field.creation_counter
+    return copy
+
+
+def _replace_argument(field, name, transform):
+    """
+    Copy an unbound field with its first argument ``name``, e.g. the form
+    class of a :class:`~wtforms.fields.FormField`, replaced by
+    ``transform(argument)``.
+    """
+    if name in field.kwargs:
+        return _copy_unbound(field, **{name: transform(field.kwargs[name])})
+    copy = _copy_unbound(field)
+    copy.args = (transform(field.args[0]),) + field.args[1:]
+    return copy
+
+
+def _form_variant(form_class, transform, prefix):
+    attrs = {}
+    for name in dir(form_class):
+        if not name.startswith('_'):
+            unbound_field = getattr(form_class, name)
+            if hasattr(unbound_field, '_formfield'):
+                attrs[name] = transform(unbound_field)
+    return type(prefix + form_class.__name__, (form_class,), attrs)
+
+
+def _disabled_password(field):
+    # passwords must not be shown, whatever the widget's hide_value is
+    render_kw = dict(field.kwargs.get('render_kw') or {}, value='')
+    return disabled(_copy_unbound(field, render_kw=render_kw))
+
+
+# fields with a _value() that is no text value
+_non_text_fields = (fields.BooleanField, fields.FileField)
+
+
+def _static_field(field):
+    field_class = field.field_class
+    if issubclass(field_class, fields.HiddenField):
+        return field
+    if issubclass(field_class, fields.FormField):
+        return _replace_argument(field, 'form_class', static_form)
+    if issubclass(field_class, fields.FieldList):
+        return _replace_argument(field, 'unbound_field', _static_field)
+    if issubclass(field_class, fields.PasswordField):
+        return _disabled_password(field)
+    if (hasattr(field_class, '_value')
+            and not issubclass(field_class, _non_text_fields)):
+        return static(_copy_unbound(field))
+    return disabled(_copy_unbound(field))
+
+
+def _disabled_field(field):
+    field_class = field.field_class
+    if issubclass(field_class, fields.FormField):
+        return _replace_argument(field, 'form_class', disabled_form)
+    if issubclass(field_class, fields.FieldList):
+        return _replace_argument(field, 'unbound_field', _disabled_field)
+    if issubclass(field_class, fields.PasswordField):
+        return _disabled_password(field)
+    return disabled(_copy_unbound(field))
+
+
+@lru_cache(maxsize=256)
+def static_form(form_class):
+    """
+    Return a read-only variant of a form class, built once per class.
+
+    Fields are wrapped with :func:`static`, fields without a text value
+    (e.g. select fields, checkboxes and file fields) with :func:`disabled`.
+    Password fields are disabled and rendered with an empty value. Hidden
+    fields are kept, :class:`~wtforms.fields.FormField` and
+    :class:`~wtforms.fields.FieldList` contents are converted as well. The
+    form class must not be modified afterwards.
+    """
+    return _form_variant(form_class, _static_field, 'Static')
+
+
+@lru_cache(maxsize=256)
+def disabled_form(form_class):
+    """
+    Return a variant of a form class with all fields wrapped with
+    :func:`disabled`, built once per class. Password fields are rendered with
+    an empty value. The form class must not be modified afterwards.
+    """
+    return _form_variant(form_class, _disabled_field, 'Disabled')
+
+
+def cached(field, cache=None):
+    """
+    Serve the markup of a field from a render cache.
+
+    Only use this for fields whose markup depends on nothing but their state,
+    e.g. fields wrapped with :func:`static` or :func:`disabled`.
+
+    :param cache: a :class:`wtforms_widgets.cache.RenderCache`, defaults to
+        the process wide :data:`wtforms_widgets.cache.render_cache`
+    """
     widget = field.kwargs.get("widget", field.field_class.widget)
-    field.kwargs["widget"] = Disabler(widget)
+    field.kwargs["widget"] = CachedRenderDecorator(widget, cache)
     return field
 
 
@@ -36,6 +179,11 @@ class LazyLoadSelectField(fields.SelectField):
     simple string - then the value of the generated <option> element is the
     same as its label or a array of two elements: [value, label].
 
+    Endpoints for large result sets should implement the search and
+    pagination protocol described in :mod:`wtforms_widgets.lazy_load`, e.g.
+    by returning :func:`wtforms_widgets.lazy_load.lazy_load_response`. Pass
+    ``page_size`` to make the widget request pages of that size.
+
     An example usage in a form would look like this:
 
         >>> from flask_wtf import FlaskForm as Form
@@ -75,6 +223,10 @@ class LazyLoadSelectField(fields.SelectField):
 
     :param conditions: The names of the fields this one depends on as a List.
     :param data_endpoint: The name of the endpoint that provides the data.
+    :param page_size: Number of items the widget requests per page.
+    :param choice_exists: Callable ``(form, value)`` telling whether the
+        submitted value is a valid item for the current conditions. Without
+        it, the submitted value is not validated.
     """
 
     widget = decorate(
@@ -87,11 +239,16 @@ class LazyLoadSelectField(fields.SelectField):
     def __init__(self, *args, **kwargs):
         self.conditions = kwargs.pop("conditions")
         self.data_endpoint = kwargs.pop("data_endpoint")
+        self.page_size = kwargs.pop("page_size", None)
+        self.choice_exists = kwargs.pop("choice_exists", None)
 
         super(LazyLoadSelectField, self).__init__(*args, **kwargs)
 
     def pre_validate(self, form):
-        pass
+        if self.choice_exists is None or self.data is None:
+            return
+        if not self.choice_exists(form, self.data):
+            raise ValidationError(self.gettext("Not a valid choice."))
 
 
 class TypeaheadField(core.StringField):
@@ -115,45 +272,166 @@ def rebuild_string(values, units):
     return ' '.join("{} {}".format(v, u) for v, u in zip(values, units))
 
 
+class Interval(namedtuple('Interval',
+                          'years months days hours minutes seconds')):
+    """
+    Value of an :class:`IntervalField`. Its string is the format of the
+    interval picker, which PostgreSQL accepts as interval input.
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        return rebuild_string(self, IntervalField.expected_units)
+
+    @classmethod
+    def from_timedelta(cls, delta):
+        minutes, seconds = divmod(delta.seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return cls(0, 0, delta.days, hours, minutes, seconds)
+
+    def to_timedelta(self):
+        """
+        Convert to a :class:`~datetime.timedelta`, counting years as 365.25
+        and months as 30 days like PostgreSQL does.
+        """
+        return timedelta(days=self.years * 365.25 + self.months * 30
+                         + self.days,
+                         hours=self.hours, minutes=self.minutes,
+                         seconds=self.seconds)
+
+
+# picker format and PostgreSQL output, e.g. "0 years 0 mons 1 days 0 hours
+# 0 mins 0 secs", "1 year 2 mons -3 days +04:05:06" or "@ 1 day 2 hours ago"
+_interval_pattern = re.compile(r"""
+    \s*(?:@\s*)?
+    (?:(?P<years>[+-]?\d+)\s+years?\s*)?
+    (?:(?P<months>[+-]?\d+)\s+mons?\s*)?
+    (?:(?P<days>[+-]?\d+)\s+days?\s*)?
+    (?:(?P<hours>[+-]?\d+)\s+hours?\s*)?
+    (?:(?P<minutes>[+-]?\d+)\s+mins?\s*)?
+    (?:(?P<seconds>[+-]?\d+)\s+secs?\s*)?
+    (?:(?P<sign>[+-]?)(?P<time>\d+:\d\d:\d\d)\s*)?
+    (?P<ago>ago\s*)?
+    \Z""", re.VERBOSE)
+
+
+def parse_interval(text):
+    """
+    Parse the interval picker format or PostgreSQL interval output into an
+    :class:`Interval`.
+
+    :raises ValueError: if ``text`` is no interval
+    """
+    match = _interval_pattern.match(text)
+    if match is None or match.lastindex is None:
+        raise ValueError("Not an interval: {!r}".format(text))
+    *units, sign, time, ago = match.groups()
+    if time is None and ago is None and None not in units:
+        return Interval._make(map(int, units))
+    values = [0 if value is None else int(value) for value in units]
+    if time is not None:
+        factor = -1 if sign == '-' else 1
+        for i, value in enumerate(time.split(':'), 3):
+            values[i] += factor * int(value)
+    if ago is not None:
+        values = [-value for value in values]
+    return Interval(*values)
+
+
+def parse_intervals(texts):
+    """
+    Parse many intervals at once, e.g. for bulk imports.
+
+    :returns: a list with the :class:`Interval`, or ``None`` if it is no
+        interval, per text
+    """
+    results = []
+    for text in texts:
+        try:
+            results.append(parse_interval(text))
+        except ValueError:
+            results.append(None)
+    return results
+
+
+def to_interval(value):
+    """
+    Convert ``value`` to an :class:`Interval`. ``None`` is kept, strings
+    not being an interval are returned unchanged.
+    """
+    if value is None or isinstance(value, Interval):
+        return value
+    if isinstance(value, timedelta):
+        return Interval.from_timedelta(value)
+    if isinstance(value, str):
+        try:
+            return parse_interval(value)
+        except ValueError:
+            return value
+    return Interval(*value)
+
+
 class IntervalField(core.StringField):
-    """A IntervalField """
+    """
+    A field for intervals, edited with the interval picker.
+
+    Its data is an :class:`Interval`, or the submitted string if it is no
+    interval. It can be populated from intervals, timedeltas, tuples of
+    six integers and strings in the picker format or PostgreSQL output.
+    :meth:`populate_obj` stores the string in the picker format, as the field
+    did before parsing its data.
+    """
+
+    expected_units = ('years', 'mons', 'days', 'hours', 'mins', 'secs')
+    expected_format = expected_interval_format(expected_units)
+    default_format = default_interval_format(expected_units)
 
     def __init__(self, *args, **kwargs):
         super(IntervalField, self).__init__(*args, **kwargs)
         kwargs.setdefault('validators', None)
-        self.expected_units = ['years', 'mons', 'days', 'hours', 'mins', 'secs']
 
     def __call__(self, **kwargs):
-        if self.data is None:
-            self.data = default_interval_format(self.expected_units)
         return super(IntervalField, self).__call__(
             class_='pycroft-interval-picker',
             # autocomplete='off',
             **kwargs
         )
 
+    def _value(self):
+        if self.data is None:
+            return self.default_format
+        return str(self.data)
+
+    def process_data(self, value):
+        self.data = to_interval(value)
+
+    def process_formdata(self, valuelist):
+        if valuelist:
+            self.data = to_interval(valuelist[0])
+
+    def populate_obj(self, obj, name):
+        setattr(obj, name, None if self.data is None else str(self.data))
+
     def pre_validate(self, form):
-        expected_format = expected_interval_format(self.expected_units)
-        generic_error = ValidationError("Expected format: {}".format(expected_format))
+        if isinstance(self.data, str):
+            self.reject(self.data)
+        if self.data is None or not any(self.data):
+            raise ValidationError("Intervalle müssen nichtleer und >0s sein.")
 
-        tokens = [x for x in self.data.split(' ') if x]
+    def reject(self, text):
+        """Raise the validation error for ``text``, which is no interval."""
+        tokens = text.split()
         values = tokens[::2]
         units = tokens[1::2]
         if not len(values) == len(units) == len(self.expected_units):
-            raise generic_error
+            raise ValidationError(
+                "Expected format: {}".format(self.expected_format))
 
-        if units != self.expected_units:
-            units = self.expected_units
-            self.data = rebuild_string(values, units)
+        if tuple(units) != self.expected_units:
+            self.data = to_interval(rebuild_string(values, self.expected_units))
             raise ValidationError(u'Format der Eingabe wurde korrigiert. Bitte prüfen.')
 
-        try:
-            decoded_values = [int(val) for val in values]
-        except ValueError:
-            raise ValidationError(u'Die Werte müssen als natürliche Zahlen angegeben werden.')
-
-        if all(val == 0 for val in decoded_values):
-            raise ValidationError("Intervalle müssen nichtleer und >0s sein.")
+        raise ValidationError(u'Die Werte müssen als natürliche Zahlen angegeben werden.')
 
 
 class MacField(fields.StringField):
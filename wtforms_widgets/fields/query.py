@@ -0,0 +1,190 @@
+"""
+Fields backed by SQLAlchemy queries, requiring the ``[sql]`` optional
+dependency group. The fields are exported by :mod:`wtforms_widgets.fields.core`,
+which imports this module on first use.
+"""
+import asyncio
+
+import wtforms_sqlalchemy.fields
+from flask import g, has_request_context, request
+
+from .core import SharedOptionsMixin
+from ..cache import SharedOptionsSelect
+from ..choices import choices_hash
+from ..widgets import BootstrapFormControlDecorator, \
+    BootstrapFormSelectDecorator, BootstrapStandardDecorator, decorate
+
+
+_OBJECT_LISTS = '_wtforms_widgets_object_lists'
+_PENDING_LOADS = '_wtforms_widgets_pending_loads'
+
+
+def _request_cache(name):
+    """
+    Return the dict stored as ``name`` on :data:`flask.g` for the current
+    request. A new dict is started for every request, also if the app
+    context outlives the request.
+    """
+    current = request._get_current_object()
+    owner, cache = g.get(name, (None, None))
+    if owner is not current:
+        cache = {}
+        setattr(g, name, (current, cache))
+    return cache
+
+
+def invalidate_choices(query_factory=None):
+    """
+    Drop the object lists shared in the current request, e.g. after the
+    objects were changed, so that they are queried again.
+
+    :param query_factory: only drop the lists of this ``query_factory`` or
+        ``async_query_factory``, defaults to all
+    """
+    if not has_request_context():
+        return
+    object_lists = _request_cache(_OBJECT_LISTS)
+    for key in list(object_lists):
+        if query_factory is None or query_factory in key[:2]:
+            del object_lists[key]
+
+
+def _options_hash(field):
+    """
+    Return :func:`~wtforms_widgets.choices.choices_hash` of the values,
+    labels and ``render_kw`` of the options of a query field.
+    """
+    return choices_hash((value, label, render_kw)
+                        for value, label, _, render_kw
+                        in field.iter_choices())
+
+
+class QueryChoicesMixin(object):
+    """
+    Load the objects of a query-backed field once per request.
+
+    Within a request, fields created with ``share_choices=True`` and the
+    same ``query_factory`` and ``get_pk`` share their object list, so
+    rendering and validating any number of forms or
+    :class:`~wtforms_widgets.fields.core.FieldList` entries runs the query
+    once. The shared lists are dropped at the end of the request or by
+    :func:`invalidate_choices`. A ``query`` assigned to the field is never
+    shared.
+
+    :param bool share_choices: share the object list with the other fields
+        of the request
+    :param async_query_factory: coroutine function returning the objects,
+        used by :meth:`load_choices` instead of ``query_factory``
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.share_choices = kwargs.pop('share_choices', False)
+        self.async_query_factory = kwargs.pop('async_query_factory', None)
+        super(QueryChoicesMixin, self).__init__(*args, **kwargs)
+
+    def _object_list_key(self):
+        if (not self.share_choices or self.query is not None
+                or not has_request_context()):
+            return None
+        return self.query_factory, self.async_query_factory, self.get_pk
+
+    def _get_object_list(self):
+        if self._object_list is not None:
+            return self._object_list
+        key = self._object_list_key()
+        if key is not None:
+            object_lists = _request_cache(_OBJECT_LISTS)
+            object_list = object_lists.get(key)
+            if object_list is not None:
+                self._object_list = object_list
+                return object_list
+        if self.query is None and self.query_factory is None \
+                and self.async_query_factory is not None:
+            raise RuntimeError(
+                "The choices of {0} have to be loaded with "
+                "'await form.load_choices()'".format(self.name))
+        object_list = super(QueryChoicesMixin, self)._get_object_list()
+        if key is not None:
+            object_lists[key] = object_list
+        return object_list
+
+    async def _load_object_list(self):
+        objects = await self.async_query_factory()
+        get_pk = self.get_pk
+        return [(str(get_pk(obj)), obj) for obj in objects]
+
+    async def load_choices(self):
+        """
+        Load the object list with ``async_query_factory``.
+
+        Fields without an async factory are loaded synchronously.
+        Concurrent calls of fields sharing the object list await the same
+        query.
+        """
+        if self._object_list is not None:
+            return self._object_list
+        if self.query is not None or self.async_query_factory is None:
+            return self._get_object_list()
+        key = self._object_list_key()
+        if key is None:
+            self._object_list = await self._load_object_list()
+            return self._object_list
+        object_lists = _request_cache(_OBJECT_LISTS)
+        if key not in object_lists:
+            pending = _request_cache(_PENDING_LOADS)
+            task = pending.get(key)
+            if task is None:
+                task = pending[key] = asyncio.ensure_future(
+                    self._load_object_list())
+                task.add_done_callback(lambda _: pending.pop(key, None))
+            object_list = await task
+            object_lists.setdefault(key, object_list)
+        self._object_list = object_lists[key]
+        return self._object_list
+
+
+class QuerySelectField(
+    SharedOptionsMixin,
+    QueryChoicesMixin,
+    wtforms_sqlalchemy.fields.QuerySelectField
+):
+    widget = decorate(
+        SharedOptionsSelect(),
+        BootstrapFormControlDecorator,
+        BootstrapFormSelectDecorator,
+        BootstrapStandardDecorator,
+    )
+
+    def option_key(self, value):
+        return value
+
+    def selected_option_keys(self):
+        data = self.data
+        if data is None:
+            return (self.blank_value,) if self.allow_blank else ()
+        return (str(self.get_pk(data)),)
+
+    def choices_fingerprint(self):
+        return _options_hash(self)
+
+
+class QuerySelectMultipleField(
+    SharedOptionsMixin,
+    QueryChoicesMixin,
+    wtforms_sqlalchemy.fields.QuerySelectMultipleField
+):
+    widget = decorate(
+        SharedOptionsSelect(multiple=True),
+        BootstrapFormControlDecorator,
+        BootstrapFormSelectDecorator,
+        BootstrapStandardDecorator,
+    )
+
+    def option_key(self, value):
+        return value
+
+    def selected_option_keys(self):
+        return [str(self.get_pk(obj)) for obj in self.data]
+
+    def choices_fingerprint(self):
+        return _options_hash(self)
@@ -3,6 +3,48 @@ from wtforms.validators import Optional, Regexp, ValidationError
 
 mac_regex = re.compile(r"^[a-f0-9]{2}(:[a-f0-9]{2}){5}$")
 
+# lower case hex digits and drop the separators of the accepted notations
+_mac_translation = str.maketrans('ABCDEF', 'abcdef', ':-.')
+_hex_digits = frozenset('0123456789abcdef')
+
+
+def normalize_mac(value):
+    """
+    Convert a MAC address to the canonical ``00:de:ad:be:ef:00`` notation.
+
+    Accepts colon or dash separated (``00-DE-AD-BE-EF-00``), dot separated
+    (``00de.adbe.ef00``) and unseparated (``00deadbeef00``) addresses in any
+    case.
+
+    :returns: the canonical address or ``None`` if the value is no MAC address
+    """
+    if not isinstance(value, str):
+        return None
+    length = len(value)
+    if length == 17:
+        separator = value[2]
+        if separator not in ':-' or value[2::3] != separator * 5:
+            return None
+    elif length == 14:
+        if value[4] != '.' or value[9] != '.':
+            return None
+    elif length != 12:
+        return None
+    digits = value.translate(_mac_translation)
+    if len(digits) != 12 or not _hex_digits.issuperset(digits):
+        return None
+    return ':'.join((digits[0:2], digits[2:4], digits[4:6],
+                     digits[6:8], digits[8:10], digits[10:12]))
+
+
+def normalize_many(values):
+    """
+    Normalize a list of MAC addresses with :func:`normalize_mac`.
+
+    :returns: a list with the canonical address or ``None`` per value
+    """
+    return [normalize_mac(value) for value in values]
+
 
 class OptionalIf(Optional):
     # makes a field optional if some other data is supplied or is not supplied
@@ -28,5 +70,48 @@ class OptionalIf(Optional):
 
 
 class MacAddress(Regexp):
-    def __init__(self, message=None):
+    """
+    Validates a MAC address in canonical notation.
+
+    :param normalize: Accept all notations understood by
+        :func:`normalize_mac` and replace the field's data with the
+        canonical address.
+    """
+
+    def __init__(self, message=None, normalize=False):
         super(MacAddress, self).__init__(mac_regex, message=message)
+        self.normalize = normalize
+
+    def __call__(self, form, field, message=None):
+        if not self.normalize:
+            return super(MacAddress, self).__call__(form, field, message)
+        mac = normalize_mac(field.data)
+        if mac is None:
+            raise ValidationError(self._message(field, message))
+        field.data = mac
+
+    def _message(self, field, message=None):
+        if message is not None:
+            return message
+        if self.message is not None:
+            return self.message
+        return field.gettext("Invalid input.")
+
+    def validate_batch(self, forms, fields):
+        if self.normalize:
+            results = []
+            for field, mac in zip(fields, normalize_many(
+                    [field.data for field in fields])):
+                if mac is None:
+                    results.append(ValidationError(self._message(field)))
+                else:
+                    field.data = mac
+                    results.append(None)
+            return results
+
+        match = self.regex.match
+        return [
+            None if match(field.data or "")
+            else ValidationError(self._message(field))
+            for field in fields
+        ]
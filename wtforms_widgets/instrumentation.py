@@ -0,0 +1,243 @@
+"""
+Opt-in timing of widget rendering and field validation.
+
+When the first :class:`Hook` is registered, the ``__call__`` methods of all
+widget decorators and widgets of :mod:`wtforms_widgets.widgets` and the
+``validate`` methods of all WTForms fields are replaced by timing wrappers
+once. The wrappers stay installed and only measure while a hook is active,
+otherwise they call the original method directly.
+
+Hooks registered with :func:`add_hook` receive the measurements of all
+threads. Hooks activated with :func:`scoped_hook` or :func:`profile` only
+receive the measurements of the current context, i.e. the current thread or
+asyncio task, so concurrent requests don't show up in a profile.
+
+Classes defined after the wrappers were installed are not instrumented.
+
+    >>> with profile():
+    ...     form = MyForm()
+    ...     html = ''.join(field(render_mode='horizontal') for field in form)
+"""
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from threading import Lock
+
+import wtforms.fields
+import wtforms.widgets
+
+from . import widgets
+
+
+class Hook(object):
+    """Receives the measurements of the instrumentation layer."""
+
+    def on_render(self, widget, field, seconds, size):
+        """
+        Called after a widget or widget decorator rendered a field.
+
+        :param widget: the widget or decorator
+        :param field: the rendered field
+        :param float seconds: time spent, including inner widgets
+        :param int size: length of the produced markup in bytes
+        """
+
+    def on_validate(self, field, seconds, valid):
+        """
+        Called after a field was validated.
+
+        :param field: the validated field
+        :param float seconds: time spent
+        :param bool valid: result of the validation
+        """
+
+
+class Stats(object):
+    __slots__ = ('calls', 'seconds', 'size')
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.size = 0
+
+    def add(self, seconds, size=0):
+        self.calls += 1
+        self.seconds += seconds
+        self.size += size
+
+
+class Profile(Hook):
+    """
+    Hook collecting call counts, cumulative time and output bytes per field
+    name and per widget or decorator type.
+    """
+
+    def __init__(self):
+        self.render_by_field = defaultdict(Stats)
+        self.render_by_widget = defaultdict(Stats)
+        self.validate_by_field = defaultdict(Stats)
+
+    def on_render(self, widget, field, seconds, size):
+        self.render_by_field[field.name].add(seconds, size)
+        self.render_by_widget[type(widget).__name__].add(seconds, size)
+
+    def on_validate(self, field, seconds, valid):
+        self.validate_by_field[field.name].add(seconds)
+
+    def report(self):
+        lines = []
+        for title, stats in (
+                ('render by field', self.render_by_field),
+                ('render by widget', self.render_by_widget),
+                ('validate by field', self.validate_by_field)):
+            if not stats:
+                continue
+            lines.append('{:<40} {:>8} {:>12} {:>12}'.format(
+                title, 'calls', 'total ms', 'bytes'))
+            for name, stat in sorted(stats.items(),
+                                     key=lambda item: -item[1].seconds):
+                lines.append('  {:<38} {:>8} {:>12.3f} {:>12}'.format(
+                    name, stat.calls, stat.seconds * 1000, stat.size))
+        return '\n'.join(lines)
+
+
+# hooks receiving the measurements of all threads, replaced on change
+_hooks = ()
+# hooks receiving the measurements of the current context only
+_scoped_hooks = ContextVar('wtforms_widgets.instrumentation.hooks',
+                           default=())
+# fields whose validation is being timed, to skip overridden super() calls
+_validating = ContextVar('wtforms_widgets.instrumentation.validating',
+                         default=frozenset())
+_lock = Lock()
+_installed = False
+
+
+def _active_hooks():
+    scoped = _scoped_hooks.get()
+    return _hooks + scoped if scoped else _hooks
+
+
+def _subclasses(cls):
+    yield cls
+    for subclass in cls.__subclasses__():
+        yield from _subclasses(subclass)
+
+
+def _instrumented_classes():
+    seen = set()
+    classes = list(_subclasses(widgets.WidgetDecorator))
+    classes.extend(cls for name, cls in vars(widgets).items()
+                   if isinstance(cls, type) and name.endswith('Widget')
+                   and cls.__module__ == widgets.__name__)
+    classes.extend(cls for cls in _subclasses(wtforms.widgets.Select)
+                   if cls.__module__.startswith('wtforms_widgets'))
+    for cls in classes:
+        if cls not in seen:
+            seen.add(cls)
+            yield cls
+
+
+def _render_wrapper(call):
+    @wraps(call)
+    def instrumented_call(self, field, *args, **kwargs):
+        hooks = _active_hooks()
+        if not hooks:
+            return call(self, field, *args, **kwargs)
+        start = time.perf_counter()
+        html = call(self, field, *args, **kwargs)
+        seconds = time.perf_counter() - start
+        size = len(str(html).encode('utf-8'))
+        for hook in hooks:
+            hook.on_render(self, field, seconds, size)
+        return html
+    return instrumented_call
+
+
+def _validate_wrapper(validate):
+    @wraps(validate)
+    def instrumented_validate(self, *args, **kwargs):
+        hooks = _active_hooks()
+        validating = _validating.get()
+        if not hooks or id(self) in validating:
+            return validate(self, *args, **kwargs)
+        token = _validating.set(validating | {id(self)})
+        try:
+            start = time.perf_counter()
+            valid = validate(self, *args, **kwargs)
+            seconds = time.perf_counter() - start
+        finally:
+            _validating.reset(token)
+        for hook in hooks:
+            hook.on_validate(self, seconds, valid)
+        return valid
+    return instrumented_validate
+
+
+def _patch(cls, name, wrapper):
+    setattr(cls, name, wrapper(cls.__dict__[name]))
+
+
+def _install():
+    """Install the wrappers, once per process."""
+    global _installed
+    with _lock:
+        if _installed:
+            return
+        for cls in _instrumented_classes():
+            if '__call__' in cls.__dict__:
+                _patch(cls, '__call__', _render_wrapper)
+        for cls in _subclasses(wtforms.fields.Field):
+            if 'validate' in cls.__dict__:
+                _patch(cls, 'validate', _validate_wrapper)
+        _installed = True
+
+
+def add_hook(hook):
+    """Register a hook receiving the measurements of all threads."""
+    global _hooks
+    _install()
+    with _lock:
+        _hooks = _hooks + (hook,)
+
+
+def remove_hook(hook):
+    """Unregister a hook registered with :func:`add_hook`."""
+    global _hooks
+    with _lock:
+        hooks = list(_hooks)
+        hooks.remove(hook)
+        _hooks = tuple(hooks)
+
+
+@contextmanager
+def scoped_hook(hook):
+    """
+    Activate a hook for the measurements of the current context within the
+    ``with`` block.
+    """
+    _install()
+    token = _scoped_hooks.set(_scoped_hooks.get() + (hook,))
+    try:
+        yield hook
+    finally:
+        _scoped_hooks.reset(token)
+
+
+@contextmanager
+def profile(file=None):
+    """
+    Profile the rendering and validation of the current context within the
+    ``with`` block and print a report afterwards.
+
+    :param file: where to print the report, defaults to ``sys.stderr``
+    """
+    with scoped_hook(Profile()) as hook:
+        try:
+            yield hook
+        finally:
+            print(hook.report(),
+                  file=file if file is not None else sys.stderr)
@@ -0,0 +1,123 @@
+"""
+Helpers for data endpoints of a
+:class:`wtforms_widgets.fields.custom.LazyLoadSelectField`.
+
+The widget requests items with the following GET arguments in addition to
+the values of the fields it depends on:
+
+``q``
+    Search text entered by the user, may be empty.
+``limit``
+    Maximum number of items to return.
+``offset``
+    Number of matching items to skip.
+``cursor``
+    Opaque token taken from ``next_cursor`` of the previous page. Takes
+    precedence over ``offset``.
+
+The endpoint answers with a json object::
+
+    {"items": [...], "next_cursor": "50", "has_more": true}
+
+where ``items`` has the format described in
+:class:`~wtforms_widgets.fields.custom.LazyLoadSelectField` and
+``next_cursor`` is ``null`` on the last page.
+"""
+from itertools import islice
+
+from flask import jsonify, request
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+def _is_query(source):
+    return callable(getattr(source, 'offset', None)) \
+        and callable(getattr(source, 'limit', None))
+
+
+def default_to_item(obj):
+    if isinstance(obj, (str, list, tuple)):
+        return obj
+    return str(obj)
+
+
+def default_search(source, q):
+    q = q.lower()
+    for obj in source:
+        item = default_to_item(obj)
+        label = item if isinstance(item, str) else item[-1]
+        if q in str(label).lower():
+            yield obj
+
+
+def paginate(source, q=None, offset=0, limit=DEFAULT_LIMIT, cursor=None,
+             search=None, to_item=None):
+    """
+    Return one page of a data source in the lazy load format.
+
+    :param source: a SQLAlchemy query (anything with ``offset()`` and
+        ``limit()`` methods) or an iterable
+    :param str q: search text, passed to ``search`` if not empty
+    :param int offset: number of items to skip
+    :param int limit: page size, capped at :data:`MAX_LIMIT`
+    :param str cursor: ``next_cursor`` of the previous page
+    :param search: callable ``(source, q)`` returning the filtered source.
+        Defaults to a case insensitive substring match on the item labels of
+        an iterable; has to be given for queries.
+    :param to_item: callable converting an object of the source to an item,
+        i.e. a string or a ``[value, label]`` pair
+    :rtype: dict
+    """
+    if cursor:
+        try:
+            offset = int(cursor)
+        except ValueError:
+            raise ValueError("Invalid cursor: {0}".format(cursor))
+    offset = max(int(offset), 0)
+    limit = min(max(int(limit), 1), MAX_LIMIT)
+    to_item = to_item if to_item is not None else default_to_item
+
+    if q:
+        if search is None:
+            if _is_query(source):
+                raise ValueError("A search function is required for queries.")
+            search = default_search
+        source = search(source, q)
+
+    # fetch one more item to tell whether there is a next page
+    if _is_query(source):
+        objs = list(source.offset(offset).limit(limit + 1))
+    else:
+        objs = list(islice(source, offset, offset + limit + 1))
+
+    has_more = len(objs) > limit
+    return {
+        "items": [to_item(obj) for obj in objs[:limit]],
+        "next_cursor": str(offset + limit) if has_more else None,
+        "has_more": has_more,
+    }
+
+
+def lazy_load_response(source, search=None, to_item=None):
+    """
+    Answer a lazy load request of the current flask request.
+
+    Reads the protocol arguments from :data:`flask.request` and returns the
+    page as json response, see :func:`paginate` for the parameters.
+    """
+    args = request.args
+    cursor = args.get('cursor')
+    if cursor and not cursor.isdigit():
+        response = jsonify(error="Invalid cursor: {0}".format(cursor))
+        response.status_code = 400
+        return response
+    return jsonify(paginate(
+        source,
+        q=args.get('q', ''),
+        offset=args.get('offset', 0, type=int),
+        limit=args.get('limit', DEFAULT_LIMIT, type=int),
+        cursor=cursor,
+        search=search,
+        to_item=to_item,
+    ))
@@ -0,0 +1,163 @@
+"""
+Validation of large :class:`~wtforms_widgets.fields.core.FieldList` of
+:class:`~wtforms_widgets.fields.core.FormField` entries in a process pool.
+
+The entries are split into chunks. Per chunk only the entry form class, the
+submitted values (``raw_data``) and the object data of the entries are
+pickled and sent to a :class:`concurrent.futures.Executor`, usually a
+:class:`~concurrent.futures.ProcessPoolExecutor`. The worker binds and
+processes the entry forms from these values and validates them. The errors
+and the data changed by validators are copied back to the entries in order,
+so the result is the same as with serial validation.
+
+Only homogeneous entries as described by
+:func:`wtforms_widgets.bulk.is_bulk_validatable` are offloaded, which were
+processed from form data and whose fields are plain input fields. The entry
+form class must be importable by the workers, i.e. defined at module level,
+CSRF protection must be disabled for it and its error messages must not be
+translated. Other entries are validated serially. Changes made to the
+entries after processing, e.g. data assigned in a view, are not seen by the
+workers.
+
+    >>> with ProcessPoolExecutor() as executor:
+    ...     form.validate(executor=executor)
+"""
+import pickle
+
+from wtforms.i18n import DummyTranslations
+
+from .bulk import is_bulk_validatable, validate_forms
+
+# message translated by every wtforms catalog
+_probe = 'This field is required.'
+
+
+def _untranslated(field):
+    translations = field._translations
+    return (isinstance(translations, DummyTranslations)
+            or translations.gettext(_probe) == _probe)
+
+
+def _no_translations(form):
+    return None
+
+
+# meta options of the entry forms bound by the workers, which have neither
+# a request nor an app context
+_worker_meta = {'csrf': False, 'get_translations': _no_translations}
+
+
+class _FormData(dict):
+    """The submitted values of an entry, mapping names to value lists."""
+
+    def getlist(self, name):
+        return self[name]
+
+
+def is_offloadable(entries):
+    """
+    Tell whether the given entries can be validated in a process pool, apart
+    from being picklable.
+    """
+    if not is_bulk_validatable(entries):
+        return False
+    form = entries[0].form
+    return (not getattr(form.meta, 'csrf', False)
+            and all(_untranslated(field) and isinstance(field.raw_data, list)
+                    for field in form._fields.values()))
+
+
+def _payload(form_class, suffixes, bulk, entries):
+    rows = []
+    for entry in entries:
+        raw_data = []
+        object_data = []
+        for field in entry.form._fields.values():
+            if field.raw_data is None:
+                # appended without form data
+                raise ValueError(field.name)
+            raw_data.append(field.raw_data)
+            object_data.append(field.object_data)
+        rows.append((entry.form._prefix, raw_data, object_data))
+    return pickle.dumps((form_class, suffixes, bulk, rows),
+                        pickle.HIGHEST_PROTOCOL)
+
+
+def _bind_form(form_class, suffixes, prefix, raw_data, object_data):
+    names = [prefix + suffix for suffix in suffixes]
+    formdata = _FormData((name, values)
+                         for name, values in zip(names, raw_data) if values)
+    return form_class(formdata=formdata, prefix=prefix,
+                      data=dict(zip(suffixes, object_data)),
+                      meta=_worker_meta)
+
+
+def validate_chunk(payload):
+    """
+    Bind and validate a pickled chunk of entries, run by the executor.
+
+    :returns: per entry the form errors and a list of ``(index, errors)``
+        tuples of the invalid fields, extended by the new data if a
+        validator replaced it
+    """
+    form_class, suffixes, bulk, rows = pickle.loads(payload)
+    forms = [_bind_form(form_class, suffixes, *row) for row in rows]
+    data = [[field.data for field in form._fields.values()] for form in forms]
+
+    if bulk:
+        validate_forms(forms)
+    else:
+        for form in forms:
+            form.validate()
+
+    results = []
+    for form, before in zip(forms, data):
+        changes = []
+        for index, (field, old) in enumerate(zip(form._fields.values(),
+                                                 before)):
+            if field.data is not old:
+                changes.append((index, field.errors, field.data))
+            elif field.errors:
+                changes.append((index, field.errors))
+        results.append((form.form_errors, changes))
+    return results
+
+
+def validate_entries(executor, entries, chunk_size, bulk=False):
+    """
+    Validate :class:`~wtforms.fields.FormField` entries in chunks of
+    ``chunk_size`` with ``executor``.
+
+    :param bool bulk: validate the chunks column-wise, see
+        :mod:`wtforms_widgets.bulk`
+    :returns: whether the entries were validated, ``False`` if they can't be
+        offloaded and need to be validated serially
+    """
+    if not is_offloadable(entries):
+        return False
+    first = entries[0].form
+    suffixes = [field.name[len(first._prefix):]
+                for field in first._fields.values()]
+    try:
+        payloads = [
+            _payload(type(first), suffixes, bulk,
+                     entries[start:start + chunk_size])
+            for start in range(0, len(entries), chunk_size)
+        ]
+    except (pickle.PicklingError, AttributeError, TypeError, ValueError):
+        return False
+
+    results = (result for chunk in executor.map(validate_chunk, payloads)
+               for result in chunk)
+    for entry, (form_errors, changes) in zip(entries, results):
+        form = entry.form
+        form.form_errors = form_errors
+        form._errors = None
+        fields = list(form._fields.values())
+        for field in fields:
+            field.errors = []
+        for index, errors, *data in changes:
+            fields[index].errors = errors
+            if data:
+                fields[index].data = data[0]
+    return True
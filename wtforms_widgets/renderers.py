@@ -0,0 +1,118 @@
+"""
+Rendering backends of the layout decorators in :mod:`wtforms_widgets.widgets`.
+
+Layout decorators (e.g. :class:`~wtforms_widgets.widgets.BootstrapStandardDecorator`)
+delegate the markup generation to a renderer. The renderer passed to the
+decorator when decorating a widget is used for all fields, otherwise it is
+looked up per field:
+
+1. the ``renderer`` attribute of the form's ``Meta``,
+2. the renderer registered for the current Flask app with
+   :func:`set_renderer`,
+3. :data:`default_renderer`, a :class:`StringRenderer`.
+
+As long as no app registered a renderer, the lookup doesn't touch Flask.
+"""
+import sys
+
+from markupsafe import Markup
+
+EXTENSION_KEY = 'wtforms_widgets.renderer'
+
+
+class StringRenderer(object):
+    """
+    Renders with the functions of the ``render_modes`` table of the
+    decorators (see :class:`~wtforms_widgets.widgets.RenderModeDecorator`),
+    or their ``render`` method for decorators without render modes.
+    """
+
+    def render(self, decorator, field, render_mode, kwargs):
+        if render_mode is None:
+            return decorator.render(field, **kwargs)
+        modes = getattr(decorator, 'render_modes', None)
+        if modes is None:
+            method = getattr(decorator, 'render_{0}'.format(render_mode), None)
+            if method is not None:
+                return method(field, **kwargs)
+        else:
+            method = modes.get(render_mode)
+            if method is not None:
+                return method(decorator, field, **kwargs)
+        raise ValueError("Unknown render mode: {0}".format(render_mode))
+
+
+class JinjaRenderer(object):
+    """
+    Renders with precompiled Jinja macros.
+
+    The macro for a decorator is named after its ``template_name`` and the
+    render mode, e.g. ``standard_horizontal``. Decorators without a
+    ``template_name`` and render modes without a macro, e.g. registered
+    ones, are rendered by a :class:`StringRenderer`.
+
+    :param jinja2.Environment environment: environment to load the template
+        from, defaults to one loading the templates of this package
+    :param str template: name of the template defining the macros
+    """
+
+    def __init__(self, environment=None,
+                 template='wtforms_widgets/bootstrap.html'):
+        if environment is None:
+            from jinja2 import Environment, PackageLoader
+            environment = Environment(
+                loader=PackageLoader('wtforms_widgets', 'templates'),
+                autoescape=True,
+            )
+        self.environment = environment
+        self.template = template
+        self.fallback = StringRenderer()
+        self._module = None
+        self._macros = {}
+
+    def macro(self, name):
+        """Return the macro called ``name``, loading the template once."""
+        try:
+            return self._macros[name]
+        except KeyError:
+            pass
+        if self._module is None:
+            self._module = self.environment.get_template(self.template).module
+        macro = self._macros[name] = getattr(self._module, name, None)
+        return macro
+
+    def render(self, decorator, field, render_mode, kwargs):
+        template_name = getattr(decorator, 'template_name', None)
+        if template_name is None:
+            return self.fallback.render(decorator, field, render_mode, kwargs)
+        if render_mode is not None:
+            template_name = '{0}_{1}'.format(template_name, render_mode)
+        macro = self.macro(template_name)
+        if macro is None:
+            return self.fallback.render(decorator, field, render_mode, kwargs)
+        return Markup(macro(decorator, field, decorator.widget, kwargs))
+
+
+#: Renderer used if neither the form nor the app configure one.
+default_renderer = StringRenderer()
+
+
+# whether set_renderer() was called, before that no app has a renderer
+_app_renderers = False
+
+
+def set_renderer(app, renderer):
+    """Use ``renderer`` for all forms rendered by ``app``."""
+    global _app_renderers
+    app.extensions[EXTENSION_KEY] = renderer
+    _app_renderers = True
+
+
+def get_renderer(field):
+    """Return the renderer responsible for ``field``."""
+    renderer = getattr(field.meta, 'renderer', None)
+    if renderer is None and _app_renderers:
+        flask = sys.modules['flask']
+        if flask.has_app_context():
+            renderer = flask.current_app.extensions.get(EXTENSION_KEY)
+    return renderer if renderer is not None else default_renderer
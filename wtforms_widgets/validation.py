@@ -0,0 +1,54 @@
+"""
+Flask views validating single fields of a
+:class:`~wtforms_widgets.base_form.BaseForm` while the user is typing.
+
+The client posts the form data and names the fields to validate with one or
+more ``field`` GET arguments, e.g. ``POST /validate/user?field=login``. The
+response is the json object returned by
+:meth:`~wtforms_widgets.base_form.BaseForm.validation_result`, or a 400
+response with an ``error`` message for unknown or missing field names.
+
+The CSRF token is only checked if it is named, the endpoint has no side
+effects. Combine with ``_lazy_binding`` to bind only the validated fields of
+large forms.
+"""
+from flask import jsonify, request
+
+
+def validation_response(form_class, **form_kwargs):
+    """
+    Answer a validation request of the current flask request.
+
+    :param form_class: a :class:`~wtforms_widgets.base_form.BaseForm`
+        subclass, instantiated with the request's form data
+    :param form_kwargs: further arguments of the form, e.g. ``obj``
+    """
+    names = request.args.getlist('field')
+    if not names:
+        return _bad_request("No field given")
+    form = form_class(**form_kwargs)
+    # errors raised while validating aren't meant for the client
+    unknown = [name for name in names if name not in form._fields]
+    if unknown:
+        return _bad_request("Unknown fields: {}".format(', '.join(unknown)))
+    return jsonify(form.validation_result(names))
+
+
+def _bad_request(message):
+    response = jsonify(error=message)
+    response.status_code = 400
+    return response
+
+
+def validation_view(form_class, **form_kwargs):
+    """
+    Return a view function serving :func:`validation_response` for
+    ``form_class``, to be registered with :meth:`flask.Flask.add_url_rule`:
+
+        >>> app.add_url_rule('/validate/user', 'validate_user',
+        ...                  validation_view(UserForm), methods=['POST'])
+    """
+    def view():
+        return validation_response(form_class, **form_kwargs)
+    view.__name__ = 'validate_{}'.format(form_class.__name__)
+    return view
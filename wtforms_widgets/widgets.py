@@ -1,14 +1,37 @@
-from functools import reduce
-from itertools import chain
+from collections import OrderedDict
+from functools import lru_cache, reduce
+from threading import Lock
+from types import FunctionType
 
 import wtforms.fields
-from flask import url_for
 from markupsafe import escape, Markup as HTMLString
-from wtforms.widgets.core import html_params
+from wtforms.meta import DefaultMeta
+from wtforms.widgets.core import clean_key, html_params
+
+from .choices import ChoiceSet
+from .renderers import StringRenderer, get_renderer
+
+
+# flask is only needed to resolve endpoint URLs, see EndpointURLCache
+_flask = None
+
+
+def _import_flask():
+    global _flask
+    import flask
+    _flask = flask
+    return flask
+
+
+def __getattr__(name):
+    if name in ('g', 'url_for'):
+        return getattr(_flask or _import_flask(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class WidgetDecorator(object):
     """Decorate widgets."""
+    __slots__ = ('widget',)
 
     def __init__(self, widget):
         """
@@ -21,6 +44,7 @@ class WidgetDecorator(object):
 
 class BootstrapFormControlDecorator(WidgetDecorator):
     """Adds the Bootstrap form-control class to a widget."""
+    __slots__ = ()
 
     def __call__(self, field, **kwargs):
         if 'class_' in kwargs:
@@ -34,76 +58,192 @@ class BootstrapFormControlDecorator(WidgetDecorator):
         return self.widget(field, **kwargs)
 
 
-class BootstrapStandardDecorator(WidgetDecorator):
+class RenderingDecorator(WidgetDecorator):
+    """
+    Decorator delegating the markup generation to a renderer, see
+    :mod:`wtforms_widgets.renderers`.
+    """
+    __slots__ = ('renderer',)
+
+    def __init__(self, widget, renderer=None):
+        """
+        :param widget: Original widget to be decorated.
+        :param renderer: Renderer used for all fields, instead of looking it
+            up per field.
+        """
+        super(RenderingDecorator, self).__init__(widget)
+        self.renderer = renderer
+
+    def renderer_for(self, field):
+        """Return the renderer rendering ``field``."""
+        renderer = self.renderer
+        return renderer if renderer is not None else get_renderer(field)
+
+
+class RenderModeDecorator(RenderingDecorator):
+    """
+    Decorator rendering a field in one of several layouts, its render modes.
+
+    The ``render_<mode>`` methods of a class and its bases are collected
+    once per class into the :attr:`render_modes` table, further modes can be
+    added with :meth:`register_render_mode`. The mode is taken from the
+    ``render_mode`` keyword argument, the ``render_mode`` attribute of the
+    form's ``Meta`` if the decorator supports it, or
+    :attr:`default_render_mode`.
+    """
+    __slots__ = ()
+    #: Mode used if neither the call nor the form specify a supported one.
+    default_render_mode = None
+    #: Maps mode names to functions ``(decorator, field, **kwargs)``.
+    render_modes = {}
+    _own_render_modes = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super(RenderModeDecorator, cls).__init_subclass__(**kwargs)
+        cls._own_render_modes = {
+            name[len('render_'):]: method
+            for name, method in vars(cls).items()
+            if name.startswith('render_') and isinstance(method, FunctionType)
+        }
+        cls._build_render_modes()
+
+    @classmethod
+    def _build_render_modes(cls):
+        modes = {}
+        for base in reversed(cls.__mro__):
+            modes.update(vars(base).get('_own_render_modes', ()))
+        cls.render_modes = modes
+        for subclass in cls.__subclasses__():
+            subclass._build_render_modes()
+
+    @classmethod
+    def register_render_mode(cls, name, method=None):
+        """
+        Register ``method(decorator, field, **kwargs)`` as render mode
+        ``name`` of this class and its subclasses, unless they define the
+        mode themselves. Without ``method``, return a decorator registering
+        the decorated function::
+
+            @BootstrapStandardDecorator.register_render_mode('floating')
+            def render_floating(decorator, field, **kwargs):
+                ...
+        """
+        if method is None:
+            return lambda method: cls.register_render_mode(name, method)
+        cls._own_render_modes[name] = method
+        cls._build_render_modes()
+        return method
+
+    def resolve_render_mode(self, field, render_mode=None):
+        """Return the render mode to render ``field`` in."""
+        if render_mode is not None:
+            return render_mode
+        render_mode = getattr(field.meta, 'render_mode', None)
+        if render_mode is not None and render_mode in self.render_modes:
+            return render_mode
+        return self.default_render_mode
+
+    def __call__(self, field, **kwargs):
+        render_mode = self.resolve_render_mode(
+            field, kwargs.pop('render_mode', None))
+        return self.renderer_for(field).render(self, field, render_mode,
+                                               kwargs)
+
+
+@lru_cache(maxsize=1024)
+def _escape_str(text):
+    return str(escape(text))
+
+
+def escaped_text(text):
+    """
+    Return ``text`` HTML escaped as plain :class:`str`.
+
+    Plain strings, like the labels and descriptions given in field
+    definitions, are escaped once and then taken from a bounded cache. Other
+    objects, e.g. :class:`~markupsafe.Markup` or lazily translated strings,
+    are escaped on every call.
+    """
+    if type(text) is str:
+        return _escape_str(text)
+    return str(escape(text))
+
+
+# opening tags of the labels, completed by the escaped field id
+_label_tags = {
+    class_: u'<label class="{0}" for="'.format(class_) if class_
+    else u'<label for="'
+    for class_ in (None, 'col-form-label', 'col-form-label text-danger',
+                   'sr-only', 'form-check-label')
+}
+
+
+def _label_html(field, class_=None):
+    """
+    Return the markup of ``field.label(class_=class_)``, with the label text
+    taken from :func:`escaped_text`. Custom label classes render themselves.
+
+    :param str class_: one of the classes of :data:`_label_tags`
+    """
+    label = field.label
+    if type(label) is not wtforms.fields.Label:
+        return label(class_=class_) if class_ is not None else label()
+    return u''.join([_label_tags[class_], str(escape(label.field_id)), u'">',
+                     escaped_text(label.text), u'</label>'])
+
+
+class BootstrapStandardDecorator(RenderModeDecorator):
     """
     Renders a field in horizontal layout.
 
     Horizontal layout is a two column layout, where the label is placed in the
     left column and the field is placed right next to it.
     """
+    __slots__ = ()
+    template_name = 'standard'
+    default_render_mode = 'basic'
 
     def render_horizontal(self, field, **kwargs):
-        error_html = [
-            Markup('<div class="invalid-feedback">{0}</div>').format(e)
-            for e in field.errors
-        ]
-        desc_html = []
+        html = [u'<div class="row" id="form-group-', escape(field.name),
+                u'"><div class="col-sm-4">',
+                _label_html(field, 'col-form-label text-danger'
+                            if field.errors else 'col-form-label')]
         if field.description:
-            desc_html.append(
-                Markup('<div class="col-sm-12"><span class="form-text">{0}</span></div>')
-                    .format(field.description)
-            )
-        label_classes = ['col-form-label']
-        if field.errors:
-            label_classes.append('text-danger')
-        html = [f'<div class="row" id="form-group-{field.name}">',
-                '<div class="col-sm-4">',
-                field.label(class_=' '.join(label_classes)),
-                *desc_html,
-                '</div>',
-                '<div class="col-sm-4">',
-                self.widget(field, **kwargs),
-                *error_html,
-                '</div>',
-                '</div>']
+            html += [u'<div class="col-sm-12"><span class="form-text">',
+                     escaped_text(field.description), u'</span></div>']
+        html += [u'</div><div class="col-sm-4">', self.widget(field, **kwargs)]
+        for e in field.errors:
+            html += [u'<div class="invalid-feedback">', escape(e), u'</div>']
+        html.append(u'</div></div>')
         return HTMLString(u''.join(html))
 
     def render_inline(self, field, **kwargs):
         return HTMLString(u''.join([
-            field.label(class_=u'sr-only'),
+            _label_html(field, 'sr-only'),
             self.widget(field, placeholder=field.label.text, **kwargs),
         ]))
 
     def render_basic(self, field, **kwargs):
-        html = [field.label(),
-                '<br/>',
-                self.widget(field, **kwargs)]
-        help_block = Markup(u'<span class="form-text">{0}</span>')
+        html = [_label_html(field), u'<br/>', self.widget(field, **kwargs)]
         if field.description:
-            html.append(help_block.format(field.description))
-        html.extend(help_block.format(e) for e in field.errors)
+            html += [u'<span class="form-text">',
+                     escaped_text(field.description), u'</span>']
+        for e in field.errors:
+            html += [u'<span class="form-text">', escape(e), u'</span>']
         return HTMLString(u''.join(html))
 
-    def __call__(self, field, **kwargs):
-        render_mode = kwargs.pop("render_mode", "basic")
-        if render_mode == "basic":
-            return self.render_basic(field, **kwargs)
-        elif render_mode == "horizontal":
-            return self.render_horizontal(field, **kwargs)
-        elif render_mode == "inline":
-            return self.render_inline(field, **kwargs)
-        else:
-            raise ValueError("Unknown render mode: {0}".format(render_mode))
-
 
-class BootstrapRadioCheckboxDecorator(WidgetDecorator):
+class BootstrapRadioCheckboxDecorator(RenderModeDecorator):
     """
     Renders a field in horizontal layout.
 
     Horizontal layout is a two column layout, where the label is placed in the
     left column and the field is placed right next to it.
     """
+    __slots__ = ()
     wrapper_class = None
+    template_name = 'check'
+    default_render_mode = 'horizontal'
 
     def _render(self, field, **kwargs):
 
@@ -113,7 +253,7 @@ class BootstrapRadioCheckboxDecorator(WidgetDecorator):
         return HTMLString(u''.join([
             u'<div class="form-check">',
             self.widget(field, **kwargs),
-            field.label(escape(field.label.text), class_='form-check-label'),
+            _label_html(field, 'form-check-label'),
             u'</div>',
         ]))
 
@@ -122,7 +262,7 @@ class BootstrapRadioCheckboxDecorator(WidgetDecorator):
 
     def render_horizontal(self, field, **kwargs):
         return HTMLString(u''.join([
-            f'<div class="row" id="form-group-{field.name}"><div class="offset-sm-4 col-sm-4">',
+            u'<div class="row" id="form-group-{0}"><div class="offset-sm-4 col-sm-4">'.format(escape(field.name)),
             self._render(field, **kwargs),
             u'</div></div>',
         ]))
@@ -130,45 +270,72 @@ class BootstrapRadioCheckboxDecorator(WidgetDecorator):
     def render_inline(self, field, **kwargs):
         return field.label(u"{0} {1}".format(
             self.widget(field, **kwargs),
-            escape(field.label.text)
+            escaped_text(field.label.text)
         ), class_=self.wrapper_class + "-inline")
 
-    def __call__(self, field, **kwargs):
-        render_mode = kwargs.pop("render_mode", "horizontal")
-        if render_mode == "basic":
-            return self.render_basic(field, **kwargs)
-        if render_mode == "horizontal":
-            return self.render_horizontal(field, **kwargs)
-        if render_mode == "inline":
-            return self.render_inline(field, **kwargs)
-        raise ValueError(f"Unknown render mode: {render_mode}")
-
 
 class BootstrapRadioDecorator(BootstrapRadioCheckboxDecorator):
+    __slots__ = ()
     wrapper_class = u"radio"
 
 
 class BootstrapCheckboxDecorator(BootstrapRadioCheckboxDecorator):
+    __slots__ = ()
     wrapper_class = u"checkbox"
 
 
+def iter_render_field(field, **kwargs):
+    """
+    Render a field as a sequence of markup chunks.
+
+    Widgets providing an ``iter_render`` method (e.g. the ones of
+    :class:`FieldList` and :class:`FormField`) are streamed, all other
+    widgets are rendered as a single chunk. Joining the chunks gives the same
+    markup as calling ``field(**kwargs)``.
+    """
+    iter_render = getattr(field.widget, 'iter_render', None)
+    if (iter_render is None
+            or type(field.meta).render_field is not DefaultMeta.render_field):
+        yield field(**kwargs)
+        return
+
+    render_kw = {clean_key(k): v for k, v in kwargs.items()}
+    other_kw = getattr(field, "render_kw", None)
+    if other_kw is not None:
+        other_kw = {clean_key(k): v for k, v in other_kw.items()}
+        render_kw = dict(other_kw, **render_kw)
+    yield from iter_render(field, **render_kw)
+
+
 class BootstrapFieldListWidget(object):
+    __slots__ = ()
+
+    def iter_render(self, field, **kwargs):
+        for e in field.errors:
+            yield Markup(u'<p class="form-text">{0}</p>').format(e)
+        for f in field:
+            yield from iter_render_field(f, **kwargs)
+
     def __call__(self, field, **kwargs):
-        return HTMLString(u''.join(chain(
-            (Markup(u'<p class="form-text">{0}</p>').format(e) for e in field.errors),
-            (f(**kwargs) for f in field)
-        )))
+        return HTMLString(u''.join(self.iter_render(field, **kwargs)))
 
 
 class BootstrapFormFieldWidget(object):
+    __slots__ = ()
+
+    def iter_render(self, field, **kwargs):
+        yield HTMLString(u"<div class=\"form-field\">")
+        for f in field:
+            yield from iter_render_field(f, **kwargs)
+        yield HTMLString(u"</div>")
+
     def __call__(self, field, **kwargs):
-        return HTMLString(u"<div class=\"form-field\">" +
-                          u''.join(f(**kwargs) for f in field) +
-                          u"</div>")
+        return HTMLString(u''.join(self.iter_render(field, **kwargs)))
 
 
 class BootstrapStaticFieldWidget(object):
     """Render a static Bootstrap control."""
+    __slots__ = ()
 
     def __call__(self, field, **kwargs):
         kwargs["class_"] = u"form-control-static"
@@ -190,15 +357,60 @@ def decorators(widget):
         widget = widget.widget
 
 
+def widget_state(widget):
+    """
+    Return the attributes of a widget, from its ``__dict__`` and
+    ``__slots__``, as sorted list of ``(name, value)`` pairs.
+    """
+    state = dict(getattr(widget, '__dict__', ()))
+    for cls in type(widget).__mro__:
+        slots = cls.__dict__.get('__slots__', ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name != '__weakref__' and hasattr(widget, name):
+                state[name] = getattr(widget, name)
+    return sorted(state.items())
+
+
+# decorated widgets by the identity of the widget passed to decorate() and
+# the decorators, least recently used first
+_interned = OrderedDict()
+_interned_lock = Lock()
+_interned_maxsize = 1024
+
+
 def decorate(widget, *decorators):
     """
     Decorate a widget with a list of decorators.
+
+    Calls with the same widget object and the same decorators return the same
+    object, as long as the chain is among the 1024 most recently requested
+    ones. Widget chains must therefore not be modified after creation.
+
     :param widget: a widget
     :param tuple[WidgetDecorator] decorators: some decorators
     :rtype: WidgetDecorator
     :returns: decorated widget
     """
-    return reduce(lambda w, d: d(w), decorators, widget)
+    key = (id(widget), decorators)
+    try:
+        with _interned_lock:
+            # the entry references the widget, so its id can't be reused
+            interned, decorated = _interned[key]
+            _interned.move_to_end(key)
+        if interned is widget:
+            return decorated
+    except KeyError:
+        pass
+    except TypeError:
+        # unhashable decorators
+        key = None
+    decorated = reduce(lambda w, d: d(w), decorators, widget)
+    if key is not None:
+        with _interned_lock:
+            _interned[key] = (widget, decorated)
+            while len(_interned) > _interned_maxsize:
+                _interned.popitem(last=False)
+    return decorated
 
 
 def decorate_field(field, *decorators):
@@ -217,11 +429,14 @@ from markupsafe import Markup
 
 class BootstrapDatepickerWidget(object):
     """Renders datetime fields using bootstrap-datepicker."""
+    __slots__ = ()
 
     def __call__(self, field, **kwargs):
         kwargs["data-provide"] = u"datepicker"
         for (option, value) in field.datepicker_options.items():
             attribute = 'data-date-{0}'.format(option.replace('_', '-'))
+            if callable(value):
+                value = value()
             kwargs[attribute] = value
         options = dict(kwargs, name=field.name)
         if field.data:
@@ -229,35 +444,185 @@ class BootstrapDatepickerWidget(object):
         return HTMLString(u"<input {0}>".format(html_params(**options)))
 
 
+def _literal(text):
+    """Escape ``text`` for use in a :meth:`str.format` template."""
+    return text.replace(u'{', u'{{').replace(u'}', u'}}')
+
+
+def _params_template(kwargs, *names):
+    """
+    Return ``html_params(**kwargs)`` as :meth:`str.format` template with
+    replacement fields for the attributes ``names``, which have to be filled
+    in escaped.
+    """
+    placeholders = {name: u'\x00{0}\x00'.format(name) for name in names}
+    params = _literal(html_params(**dict(kwargs, **placeholders)))
+    for name, placeholder in placeholders.items():
+        params = params.replace(placeholder, u'{%s}' % name)
+    return params
+
+
+def _escaped_choices(field, choices):
+    """
+    Return the escaped ``(value, label)`` pairs of the ``choices`` of
+    ``field.iter_choices()``, precomputed if the field has a
+    :class:`~wtforms_widgets.choices.ChoiceSet`.
+    """
+    choice_set = getattr(field, 'choices', None)
+    if isinstance(choice_set, ChoiceSet) and len(choice_set) == len(choices):
+        return choice_set.escaped()
+    return [(str(escape(value)), str(escape(label)))
+            for value, label, *_ in choices]
+
+
 class CheckBoxWidget(wtforms.widgets.Select):
     """A simple multi selection widget rendered as Checkbox list.
 
-    It uses the bootstrap markup.
+    It uses the bootstrap markup. The markup of all choices is built from two
+    templates, for checked and unchecked choices, which are computed once per
+    call.
     """
 
     def __call__(self, field, **kwargs):
         kwargs.setdefault('type', 'checkbox')
         field_id = kwargs.pop('id', field.id)
-        html = []
-        for value, label, checked in field.iter_choices():
-            choice_id = u'{}-{}'.format(field_id, value)
-            options = dict(kwargs, name=field.name, value=value, id=choice_id)
-            html.append(u'<label class="checkbox" {}>'.format(html_params(id=field_id)))
-            if checked:
-                options['checked'] = 'checked'
-            html.append(u'<input {}>'.format(html_params(**options)))
-            html.append(label)
-            html.append(u'</label>')
-        return u''.join(html)
+        kwargs['name'] = field.name
+        label = _literal(u'<label class="checkbox" {}>'.format(
+            html_params(id=field_id)))
+        unchecked = u'{0}<input {1}>{{label}}</label>'.format(
+            label, _params_template(kwargs, 'id', 'value'))
+        checked = u'{0}<input {1}>{{label}}</label>'.format(
+            label, _params_template(dict(kwargs, checked='checked'),
+                                    'id', 'value'))
+        prefix = str(escape(field_id)) + u'-'
+        choices = list(field.iter_choices())
+        return HTMLString(u''.join([
+            (checked if selected else unchecked).format(
+                id=prefix + value, value=value, label=label)
+            for (value, label), (_, _, selected, *_)
+            in zip(_escaped_choices(field, choices), choices)
+        ]))
+
+
+class BootstrapRadioListWidget(BootstrapFieldListWidget):
+    """
+    Renders the options of a :class:`~wtforms.fields.RadioField` like
+    :class:`BootstrapFieldListWidget` with a ``BootstrapRadioDecorator``
+    option widget would, but from templates computed once per call instead
+    of binding and rendering a field per option.
+
+    The ``inline`` render mode, other option widgets or renderers and choices
+    with ``render_kw`` are rendered option by option.
+    """
+    __slots__ = ()
+
+    def _templates(self, field, kwargs):
+        option_widget = field.option_widget
+        if type(option_widget) is not BootstrapRadioDecorator:
+            return None
+        render_mode = option_widget.resolve_render_mode(
+            field, kwargs.get('render_mode'))
+        if (render_mode not in ('basic', 'horizontal')
+                or option_widget.render_modes[render_mode] is not getattr(
+                    BootstrapRadioCheckboxDecorator, 'render_' + render_mode)
+                or type(option_widget.widget) is not wtforms.widgets.RadioInput
+                or widget_state(option_widget.widget)
+                or type(field.meta).render_field is not DefaultMeta.render_field
+                or type(option_widget.renderer_for(field))
+                is not StringRenderer
+                or not kwargs.keys().isdisjoint(
+                    ('id', 'name', 'type', 'value', 'checked'))):
+            return None
+
+        # what BootstrapRadioDecorator and RadioInput do per option
+        kwargs = dict(kwargs, name=field.name, type='radio')
+        kwargs.pop('render_mode', None)
+        kwargs['class_'] = ' '.join(kwargs.get('class_', '').split()
+                                    + ['form-check-input'])
+        flags = field.flags
+        for k in dir(flags):
+            if (k in wtforms.widgets.RadioInput.validation_attrs
+                    and k not in kwargs):
+                kwargs[k] = getattr(flags, k)
+
+        option = (u'<div class="form-check"><input {0}>'
+                  u'<label class="form-check-label" for="{{id}}">{{label}}'
+                  u'</label></div>')
+        templates = (
+            option.format(_params_template(kwargs, 'id', 'value')),
+            option.format(_params_template(dict(kwargs, checked=True),
+                                           'id', 'value')),
+        )
+        if render_mode == 'horizontal':
+            # added after the first format, so escaped for the last one only
+            start = u''.join([
+                _literal(u'<div class="row" id="form-group-{0}">'.format(
+                    escape(field.name))),
+                u'<div class="offset-sm-4 col-sm-4">',
+            ])
+            templates = tuple(start + template + u'</div></div>'
+                              for template in templates)
+        return templates
+
+    def iter_render(self, field, **kwargs):
+        templates = self._templates(field, kwargs)
+        choices = list(field.iter_choices()) if templates is not None else ()
+        if templates is None or any(
+                label is None or render_kw
+                for _, label, _, render_kw in choices):
+            yield from super(BootstrapRadioListWidget, self).iter_render(
+                field, **kwargs)
+            return
+
+        for e in field.errors:
+            yield Markup(u'<p class="form-text">{0}</p>').format(e)
+        unchecked, checked = templates
+        prefix = str(escape(field.id)) + u'-'
+        yield HTMLString(u''.join([
+            (checked if selected else unchecked).format(
+                id=prefix + str(i), value=value, label=label)
+            for i, ((value, label), (_, _, selected, _))
+            in enumerate(zip(_escaped_choices(field, choices), choices))
+        ]))
 
 
 class BootstrapFormSelectDecorator(WidgetDecorator):
+    __slots__ = ()
+
     def __call__(self, field, **kwargs):
         classes = kwargs.get('class_', '').split()
         kwargs['class_'] = ' '.join(classes + ['form-select'])
         return self.widget(field, **kwargs)
 
 
+class EndpointURLCache(object):
+    """
+    Resolves the URLs of endpoints without arguments once per application
+    context, i.e. once per request.
+
+    The resolved URLs are stored on :data:`flask.g`, so they never outlive
+    the URL map they were built with. :attr:`lookups` counts the calls of
+    :func:`flask.url_for`.
+    """
+    __slots__ = ('lookups',)
+
+    def __init__(self):
+        self.lookups = 0
+
+    def __call__(self, endpoint):
+        flask = _flask or _import_flask()
+        urls = flask.g.setdefault('_wtforms_widgets_endpoint_urls', {})
+        try:
+            return urls[endpoint]
+        except KeyError:
+            self.lookups += 1
+            url = urls[endpoint] = flask.url_for(endpoint)
+            return url
+
+
+endpoint_url = EndpointURLCache()
+
+
 class LazyLoadSelectWidget(wtforms.widgets.Select):
     """This is the widget for the LazyLoadSelectField
 
@@ -269,34 +634,49 @@ class LazyLoadSelectWidget(wtforms.widgets.Select):
         if conditions is not None:
             kwargs["data-fieldids"] = ",".join(conditions)
         kwargs['data-role'] = u'lazy-load-select'
-        kwargs['data-url'] = url_for(field.data_endpoint)
+        kwargs['data-url'] = endpoint_url(field.data_endpoint)
+        page_size = getattr(field, "page_size", None)
+        if page_size is not None:
+            kwargs['data-page-size'] = page_size
         kwargs['value'] = str(field.data)
 
         return super(LazyLoadSelectWidget, self).__call__(field, **kwargs)
 
 
 class Disabler(WidgetDecorator):
+    __slots__ = ()
+
     def __call__(self, field, **kwargs):
         kwargs['disabled'] = True
         return self.widget(field, **kwargs)
 
 
-class MoneyFieldDecorator(WidgetDecorator):
+class MoneyFieldDecorator(RenderingDecorator):
     """Adds the Bootstrap form-control class to a widget."""
+    __slots__ = ()
+    template_name = 'money'
 
-    def __call__(self, field, **kwargs):
+    def render(self, field, **kwargs):
         kwargs['class_'] += ' money-amount'
         group_cls = 'input-group' + (' is-invalid' if field.errors else '')
         return Markup(
             '<div class="{}">{}<span class="input-group-text">€</span></div>'
         ).format(group_cls, self.widget(field, **kwargs))
 
+    def __call__(self, field, **kwargs):
+        return self.renderer_for(field).render(self, field, None, kwargs)
+
 
-class MacFieldDecorator(WidgetDecorator):
+class MacFieldDecorator(RenderingDecorator):
     """Adds an addon which shows the vendor."""
+    __slots__ = ()
+    template_name = 'mac'
 
-    def __call__(self, field, **kwargs):
+    def render(self, field, **kwargs):
         group_cls = 'input-group' + (' is-invalid' if field.errors else '')
         return Markup(
             '<div class="{}">{}<div class="input-group-text mac-manufacturer">?</div></div>'
         ).format(group_cls, self.widget(field, **kwargs))
+
+    def __call__(self, field, **kwargs):
+        return self.renderer_for(field).render(self, field, None, kwargs)